@@ -0,0 +1,113 @@
+import asyncio
+import hashlib
+import multiprocessing as mp
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import bcrypt
+import jwt
+
+from cache import LRUCache
+
+# ==========================================
+# 비밀번호 해시 (전용 프로세스 풀) + JWT 검증 캐시
+# ==========================================
+# bcrypt 는 한 번에 수백 ms 의 CPU 를 쓰므로 API 스레드풀이 아닌 별도 프로세스 풀에서 돌리고,
+# 대기 중인 해시 작업이 max_pending 을 넘으면 바로 HasherBusy 를 던져서(429) 부하를 덜어냅니다.
+
+
+class HasherBusy(Exception):
+    pass
+
+
+def _hash_password(password, rounds):
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+def _check_password(password, password_hash):
+    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+class PasswordHasher:
+    def __init__(self, workers=2, rounds=12, max_pending=16):
+        self.workers = max(1, int(workers))
+        self.rounds = int(rounds)
+        self.max_pending = max(1, int(max_pending))
+        self._pool = None
+        self._pending = 0   # 이벤트 루프 스레드에서만 바뀝니다.
+        self.rejected = 0
+
+    # --- 수명 주기 ---
+    def start(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp.get_context("spawn"))
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # --- 공개 API ---
+    async def _run(self, fn, *args):
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise HasherBusy()
+        self.start()
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password):
+        return await self._run(_hash_password, password, self.rounds)
+
+    async def verify(self, password, password_hash):
+        if not password_hash:
+            return False
+        return await self._run(_check_password, password, password_hash)
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "rounds": self.rounds,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+        }
+
+
+class TokenVerifier:
+    """JWT 발급/검증. 한 번 검증한 토큰은 (토큰 만료 시각과 ttl 중 이른 때까지) 캐시해서 다시 검증하지 않습니다."""
+
+    def __init__(self, secret, algorithm="HS256", token_ttl_seconds=7 * 24 * 3600,
+                 cache_entries=10000, cache_ttl_seconds=300):
+        self.secret = secret
+        self.algorithm = algorithm
+        self.token_ttl_seconds = int(token_ttl_seconds)
+        self._cache = LRUCache(max_entries=cache_entries, max_bytes=16 * 1024 * 1024, ttl_seconds=cache_ttl_seconds)
+
+    def issue(self, username):
+        now = int(time.time())
+        claims = {"sub": username, "iat": now}
+        if self.token_ttl_seconds > 0:
+            claims["exp"] = now + self.token_ttl_seconds
+        return jwt.encode(claims, self.secret, algorithm=self.algorithm)
+
+    def verify(self, token):
+        """검증된 claims 를 돌려주고, 잘못됐거나 만료된 토큰이면 None."""
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        claims = self._cache.get(key)
+        if claims is None:
+            try:
+                claims = jwt.decode(token, self.secret, algorithms=[self.algorithm])
+            except jwt.InvalidTokenError:
+                return None
+            self._cache.put(key, claims)
+        # 캐시에 있던 토큰이라도 exp 가 지났으면 거절합니다.
+        if "exp" in claims and claims["exp"] <= time.time():
+            return None
+        return claims
+
+    def stats(self):
+        return self._cache.stats()
@@ -0,0 +1,159 @@
+import inspect
+import os
+
+import numpy as np
+import torch
+import torch.nn as nn
+from transformers import AutoConfig, AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
+
+# ==========================================
+# 감성 분석 추론 백엔드 (pipeline / quantized / onnx)
+# ==========================================
+# 어떤 백엔드든 texts(list[str]) -> [{"label": ..., "score": ...}, ...] 모양을 돌려줍니다.
+BACKENDS = ("pipeline", "quantized", "onnx")
+
+ONNX_EXPORT_DIR = "./models/onnx"
+
+
+def load_sentiment_backend(name, model_id, pipeline_device=-1):
+    if name == "pipeline":
+        return _load_pipeline(model_id, pipeline_device)
+    if name == "quantized":
+        return _load_quantized(model_id)
+    if name == "onnx":
+        return _load_onnx(model_id)
+    raise ValueError(f"Unknown inference backend: {name} (choose from {', '.join(BACKENDS)})")
+
+
+def _load_pipeline(model_id, pipeline_device):
+    clf = pipeline("sentiment-analysis", model=model_id, device=pipeline_device)
+
+    def run(texts):
+        return clf(texts, batch_size=len(texts), truncation=True)
+    return run
+
+
+def _load_quantized(model_id):
+    # Linear 레이어만 int8 동적 양자화 (CPU 전용)
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    model = AutoModelForSequenceClassification.from_pretrained(model_id).eval()
+    qmodel = torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+    clf = pipeline("sentiment-analysis", model=qmodel, tokenizer=tokenizer, device=-1)
+
+    def run(texts):
+        return clf(texts, batch_size=len(texts), truncation=True)
+    return run
+
+
+def export_onnx(model_id, export_dir=ONNX_EXPORT_DIR):
+    """model_id 를 ONNX 로 내보내고 파일 경로를 돌려줍니다. 이미 있으면 재사용합니다."""
+    target_dir = os.path.join(export_dir, model_id.replace("/", "__"))
+    onnx_path = os.path.join(target_dir, "model.onnx")
+    if os.path.exists(onnx_path):
+        return onnx_path
+
+    os.makedirs(target_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    model = AutoModelForSequenceClassification.from_pretrained(model_id).eval()
+    model.config.return_dict = False
+    dummy = tokenizer(["onnx export"], return_tensors="pt")
+    input_names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in dummy]
+
+    export_kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs["dynamo"] = False
+
+    tmp_path = onnx_path + ".tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(dummy[n] for n in input_names),
+            tmp_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes={**{n: {0: "batch", 1: "seq"} for n in input_names}, "logits": {0: "batch"}},
+            opset_version=17,
+            **export_kwargs,
+        )
+    os.replace(tmp_path, onnx_path)
+    return onnx_path
+
+
+def _load_onnx(model_id):
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        raise RuntimeError("INFERENCE_BACKEND=onnx 를 쓰려면 onnxruntime 을 설치해야 합니다. (pip install onnxruntime)")
+
+    onnx_path = export_onnx(model_id)
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    id2label = AutoConfig.from_pretrained(model_id).id2label
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+    input_names = [i.name for i in session.get_inputs()]
+
+    def run(texts):
+        enc = tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+        logits = session.run(None, {n: enc[n].astype(np.int64) for n in input_names})[0]
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+        best = probs.argmax(axis=1)
+        return [{"label": id2label[int(i)], "score": float(probs[row, i])} for row, i in enumerate(best)]
+    return run
+
+
+# ------------------------------------------
+# 허브에 업로드된 모델 (storage/models/{name}/) 을 pipeline 으로 불러오기
+# ------------------------------------------
+# config.json 의 architectures 로 pipeline 작업을 고릅니다. safetensors 가중치는 transformers 가
+# mmap 으로 읽으므로 여러 모델을 올려도 실제로 건드린 페이지만 메모리에 올라옵니다.
+ARCHITECTURE_TASKS = (
+    ("ForSequenceClassification", "text-classification"),
+    ("ForTokenClassification", "token-classification"),
+    ("ForMaskedLM", "fill-mask"),
+    ("ForCausalLM", "text-generation"),
+    ("ForConditionalGeneration", "text2text-generation"),
+)
+# 요청에서 넘길 수 있는 pipeline 인자와 상한
+HUB_PIPELINE_PARAMETERS = {"top_k": 20, "max_new_tokens": 256}
+
+
+def task_for_config(config):
+    for architecture in config.architectures or []:
+        for suffix, task in ARCHITECTURE_TASKS:
+            if architecture.endswith(suffix):
+                return task
+    raise ValueError(f"지원하지 않는 모델 구조입니다: {config.architectures}")
+
+
+def _jsonable(value):
+    # pipeline 결과의 numpy 스칼라 등을 JSON 으로 보낼 수 있는 값으로 바꿉니다.
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def load_hub_pipeline(model_dir, pipeline_device=-1):
+    """run(texts, parameters) -> 입력마다 결과 하나인 리스트."""
+    config = AutoConfig.from_pretrained(model_dir)
+    task = task_for_config(config)
+    clf = pipeline(task, model=model_dir, tokenizer=model_dir, device=pipeline_device)
+    call_kwargs = {"truncation": True} if task == "text-classification" else {}
+
+    def run(texts, parameters=None):
+        kwargs = dict(call_kwargs)
+        for key, value in (parameters or {}).items():
+            if key in HUB_PIPELINE_PARAMETERS:
+                kwargs[key] = max(1, min(int(value), HUB_PIPELINE_PARAMETERS[key]))
+        with torch.inference_mode():
+            return _jsonable(clf(texts, batch_size=len(texts), **kwargs))
+    run.task = task
+    return run
@@ -0,0 +1,315 @@
+import csv
+import hashlib
+import io
+import json
+import multiprocessing as mp
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from blobs import blob_path, hash_file
+from storage import STORAGE_ROOT, UPLOAD_TEMP_PREFIX, repo_dir
+
+# ==========================================
+# 데이터셋 CSV 일괄 추론 (작업자 프로세스 안에서 실행됩니다)
+# ==========================================
+# 입력은 매니페스트가 가리키는 blob(내용이 바뀌지 않는 파일) 을 한 레코드씩 읽고, 큰 배치로 묶어
+# 추론 프로세스 풀에 보냅니다. 결과는 들어간 순서대로 데이터셋 폴더의 임시 파일에 이어 쓰고,
+# 주기적으로 fsync 한 뒤 "입력 바이트 위치 / 처리한 행 수 / 출력 크기" 를 진행 파일에 기록(commit) 합니다.
+# 서버가 다시 뜨면 진행 파일을 찾아 마지막 commit 지점부터 이어서 돌립니다. (그 뒤에 쓴 출력은 잘라냄)
+# 다 끝나면 출력 파일을 blob 저장소에 등록해서 데이터셋 파일 목록에 나타나게 합니다.
+BATCH_JOB_PREFIX = f"{UPLOAD_TEMP_PREFIX}batch-"
+OUTPUT_HEADER = ["row", "text", "label", "score"]
+RESUME_KEYS = ("dataset", "sha256", "text_column", "model", "output")
+
+
+class BatchCancelled(Exception):
+    pass
+
+
+def job_key(dataset, sha256, text_column, model, output):
+    raw = json.dumps([dataset, sha256, text_column, model, output])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def job_paths(dataset, key):
+    base = os.path.join(repo_dir("datasets", dataset), f"{BATCH_JOB_PREFIX}{key}")
+    return base + ".csv.part", base + ".json"
+
+
+def default_output_name(filename):
+    return f"{os.path.splitext(filename)[0]}.predictions.csv"
+
+
+def find_unfinished_jobs(root=STORAGE_ROOT):
+    """돌던 중에 서버가 멈춘(status=running) 진행 파일의 작업 인자 목록 (서버 시작 시 이어서 돌리기용).
+
+    사용자가 취소했거나 실패한 작업은 같은 요청을 다시 보낼 때만 이어서 돌립니다.
+    """
+    jobs = []
+    try:
+        datasets = [e for e in os.scandir(os.path.join(root, "datasets")) if e.is_dir()]
+    except FileNotFoundError:
+        return jobs
+    for dataset_dir in datasets:
+        for entry in os.scandir(dataset_dir.path):
+            if entry.name.startswith(BATCH_JOB_PREFIX) and entry.name.endswith(".json"):
+                try:
+                    with open(entry.path) as f:
+                        saved = json.load(f)
+                    if saved.get("status", "running") == "running":
+                        jobs.append(saved["params"])
+                except (OSError, ValueError, KeyError):
+                    continue
+    return jobs
+
+
+# ------------------------------------------
+# CSV 레코드 읽기 (바이트 위치 추적)
+# ------------------------------------------
+def iter_records(fp):
+    """(레코드가 끝난 바이트 위치, 필드 목록). 따옴표 안의 줄바꿈은 한 레코드로 묶습니다."""
+    buf = b""
+    while True:
+        line = fp.readline()
+        if line:
+            buf += line
+            if buf.count(b'"') % 2:
+                continue
+        if not buf:
+            return
+        text = buf.decode("utf-8-sig" if buf.startswith(b"\xef\xbb\xbf") else "utf-8", errors="replace")
+        yield fp.tell(), next(csv.reader(io.StringIO(text)), [])
+        buf = b""
+        if not line:
+            return
+
+
+# ------------------------------------------
+# 추론 프로세스 풀
+# ------------------------------------------
+_classifier = None
+
+
+def _load_classifier(model, threads=None):
+    import torch
+    if threads:
+        torch.set_num_threads(threads)
+    from backends import load_hub_pipeline, load_sentiment_backend
+    if model:
+        run = load_hub_pipeline(repo_dir("models", model))
+        if run.task != "text-classification":
+            raise ValueError(f"텍스트 분류 모델만 쓸 수 있습니다. ({model}: {run.task})")
+        return run
+    return load_sentiment_backend(
+        os.getenv("INFERENCE_BACKEND", "pipeline"),
+        os.getenv("SENTIMENT_MODEL_ID", "nlptown/bert-base-multilingual-uncased-sentiment"),
+    )
+
+
+def _init_worker(model, threads):
+    global _classifier
+    _classifier = _load_classifier(model, threads)
+
+
+def _infer(texts):
+    return _classifier(texts)
+
+
+class _InlineFuture:
+    def __init__(self, value):
+        self._value = value
+
+    def result(self):
+        return self._value
+
+
+# ------------------------------------------
+# 작업 본체
+# ------------------------------------------
+def _load_progress(progress_path, params):
+    try:
+        with open(progress_path) as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # 배치 크기나 프로세스 수가 달라져도 출력은 같으므로 입력/출력이 같으면 이어서 씁니다.
+    same = all(saved.get("params", {}).get(k) == params[k] for k in RESUME_KEYS)
+    return saved if same else None
+
+
+def _save_progress(progress_path, state):
+    tmp_path = f"{progress_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, progress_path)
+
+
+def _set_status(progress_path, status):
+    # 마지막 commit 에 기록된 내용은 그대로 두고 상태만 바꿉니다.
+    try:
+        with open(progress_path) as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return
+    saved["status"] = status
+    _save_progress(progress_path, saved)
+
+
+def set_job_status(params, status):
+    """params 작업의 진행 파일 상태를 바꿉니다. (서버 종료 시 다시 running 으로 돌려 두기용)"""
+    key = job_key(params["dataset"], params["sha256"], params["text_column"], params["model"], params["output"])
+    _set_status(job_paths(params["dataset"], key)[1], status)
+
+
+def run_batch_inference(dataset, filename, sha256, text_column, output, report, should_stop,
+                        model=None, batch_size=256, workers=1, commit_seconds=5.0):
+    """dataset 의 filename(blob sha256) 에서 text_column 을 읽어 분류하고 output 으로 등록합니다."""
+    params = {"dataset": dataset, "filename": filename, "sha256": sha256, "text_column": text_column,
+              "output": output, "model": model, "batch_size": batch_size, "workers": workers}
+
+    def log(message):
+        report({"type": "log", "message": f"[{time.strftime('%H:%M:%S')}] {message}"})
+
+    key = job_key(dataset, sha256, text_column, model, output)
+    partial_path, progress_path = job_paths(dataset, key)
+    input_path = blob_path(sha256)
+    if not os.path.exists(input_path):
+        # 입력 파일이 지워졌으면 이어서 돌릴 수 없으므로 진행 기록도 정리합니다.
+        for path in (partial_path, progress_path):
+            if os.path.exists(path):
+                os.remove(path)
+        raise FileNotFoundError(f"입력 파일이 없습니다: {filename}")
+    input_size = os.path.getsize(input_path)
+    state = _load_progress(progress_path, params)
+    if state and not os.path.exists(partial_path):
+        # 출력이 이미 blob 으로 옮겨진 뒤(진행 파일을 지우기 전) 죽었거나 .part 가 지워진 경우:
+        # 없는 파일을 잘라 늘리면 0 으로 채워지므로 처음부터 다시 만듭니다.
+        state = None
+
+    with open(input_path, "rb") as src:
+        header_end, header = next(iter_records(src), (0, []))
+        if text_column not in header:
+            raise ValueError(f"'{text_column}' 컬럼이 없습니다. (컬럼: {', '.join(header)})")
+        column = header.index(text_column)
+
+        out = open(partial_path, "r+b" if state else "w+b")
+        try:
+            if state:
+                # 마지막 commit 이후에 쓴 출력은 버리고 그 지점부터 다시 읽습니다.
+                out.truncate(state["output_bytes"])
+                out.seek(state["output_bytes"])
+                src.seek(state["input_offset"])
+                state.update(params=params, status="running")
+                _save_progress(progress_path, state)
+                log(f"Resuming {filename} at row {state['rows']} ({state['input_offset']}/{input_size} bytes)")
+            else:
+                out.write(",".join(OUTPUT_HEADER).encode("utf-8") + b"\n")
+                state = {"params": params, "status": "running", "input_offset": header_end, "rows": 0,
+                         "output_bytes": out.tell()}
+                _save_progress(progress_path, state)
+                log(f"Batch inference started: {filename} ({input_size} bytes), batch {batch_size}, workers {workers}")
+            try:
+                _run(src, out, column, state, progress_path, input_size, params, report, should_stop, log,
+                     commit_seconds)
+            except BatchCancelled:
+                _set_status(progress_path, "cancelled")
+                raise
+            except Exception:
+                _set_status(progress_path, "failed")
+                raise
+        finally:
+            out.close()
+
+    # 결과 파일을 blob 으로 옮겨 데이터셋 파일로 등록합니다.
+    from database import SessionLocal
+    from blobs import add_file
+    from listing import bump_listing_version
+    from storage import refresh_storage_stats
+    db = SessionLocal()
+    try:
+        add_file(db, "datasets", dataset, output, hash_file(partial_path), os.path.getsize(partial_path),
+                 src_path=partial_path)
+        refresh_storage_stats(db, "datasets", dataset)
+        bump_listing_version(db, "datasets")
+        db.commit()
+    finally:
+        db.close()
+    os.remove(progress_path)
+    log(f"Saved {state['rows']} predictions to {output}")
+
+
+def _run(src, out, column, state, progress_path, input_size, params, report, should_stop, log, commit_seconds):
+    batch_size, workers = max(1, params["batch_size"]), max(1, params["workers"])
+    if workers > 1:
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(params["model"], threads))
+        submit = lambda texts: pool.submit(_infer, texts)
+    else:
+        pool = None
+        classifier = _load_classifier(params["model"])
+        submit = lambda texts: _InlineFuture(classifier(texts))
+
+    started = time.perf_counter()
+    started_rows = state["rows"]
+    last_commit = started
+    in_flight = deque()            # (future, rows[(row, text)], 입력 끝 위치)
+    next_row = state["rows"]
+
+    def commit():
+        out.flush()
+        os.fsync(out.fileno())
+        state["output_bytes"] = out.tell()
+        _save_progress(progress_path, state)
+        elapsed = time.perf_counter() - started
+        rows_per_sec = (state["rows"] - started_rows) / elapsed if elapsed > 0 else 0.0
+        report({
+            "type": "progress", "progress": int(state["input_offset"] * 100 / input_size) if input_size else 100,
+            "rows": state["rows"], "rows_per_sec": round(rows_per_sec, 1),
+        })
+
+    def write_oldest():
+        future, rows, end_offset = in_flight.popleft()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for (row, text), result in zip(rows, future.result()):
+            writer.writerow([row, text, result["label"], round(float(result["score"]), 6)])
+        out.write(buffer.getvalue().encode("utf-8"))
+        state["rows"] += len(rows)
+        state["input_offset"] = end_offset
+
+    try:
+        batch, end_offset = [], state["input_offset"]
+        records = iter_records(src)
+        while True:
+            record = next(records, None)
+            if record is not None:
+                end_offset, fields = record
+                batch.append((next_row, fields[column] if column < len(fields) else ""))
+                next_row += 1
+                if len(batch) < batch_size:
+                    continue
+            if batch:
+                in_flight.append((submit([text for _, text in batch]), batch, end_offset))
+                batch = []
+            # 풀이 놀지 않을 만큼만 미리 보내고, 결과는 보낸 순서대로 씁니다.
+            while in_flight and (len(in_flight) >= workers * 2 or record is None):
+                write_oldest()
+            if time.perf_counter() - last_commit >= commit_seconds:
+                commit()
+                last_commit = time.perf_counter()
+            if should_stop():
+                while in_flight:
+                    write_oldest()
+                commit()
+                raise BatchCancelled()
+            if record is None:
+                break
+        commit()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,95 @@
+"""감성 분석 백엔드 벤치마크 (pipeline / quantized / onnx)
+
+사용 예:
+    python bench_backends.py --backends pipeline,quantized,onnx --requests 200 --batch-sizes 1,8,32
+
+각 백엔드의 p50/p99 지연시간, 처리량(texts/sec), 그리고 첫 번째 백엔드 대비
+라벨 일치율(accuracy agreement)을 출력합니다.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from backends import BACKENDS, load_sentiment_backend
+
+SAMPLE_TEXTS = [
+    "I love this product, it works perfectly!",
+    "Terrible experience, it broke after two days.",
+    "It's okay, nothing special but does the job.",
+    "배송도 빠르고 품질도 아주 좋아요.",
+    "생각보다 별로네요. 다시는 안 살 것 같아요.",
+    "Das Essen war ausgezeichnet und der Service freundlich.",
+    "Le produit est arrivé cassé, très déçu.",
+    "El hotel estaba limpio y el personal fue muy amable.",
+    "Not bad for the price, but the battery life could be better.",
+    "가격 대비 무난합니다. 그냥 평범해요.",
+    "Absolutely fantastic, exceeded all my expectations.",
+    "Worst customer support I have ever dealt with.",
+]
+
+
+def percentile(values, p):
+    return float(np.percentile(np.asarray(values), p)) * 1000.0
+
+
+def run_backend(name, run, texts, batch_size, warmup):
+    for _ in range(warmup):
+        run(texts[:batch_size])
+
+    latencies = []
+    labels = []
+    started = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        chunk = texts[i:i + batch_size]
+        t0 = time.perf_counter()
+        out = run(chunk)
+        latencies.append(time.perf_counter() - t0)
+        labels.extend(r["label"] for r in out)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "backend": name,
+        "batch_size": batch_size,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "texts_per_sec": round(len(texts) / elapsed, 1),
+    }, labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentiment backend latency/throughput benchmark")
+    parser.add_argument("--model", default="nlptown/bert-base-multilingual-uncased-sentiment")
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--requests", type=int, default=200, help="벤치마크에 쓸 문장 수")
+    parser.add_argument("--batch-sizes", default="1,8,32")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args()
+
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] + f" #{i}" for i in range(args.requests)]
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",")]
+
+    loaded = {name: load_sentiment_backend(name, args.model, -1) for name in backends}
+
+    rows = []
+    for batch_size in batch_sizes:
+        reference = None
+        for name in backends:
+            row, labels = run_backend(name, loaded[name], texts, batch_size, args.warmup)
+            if reference is None:
+                reference = labels
+            row["agreement"] = round(sum(a == b for a, b in zip(reference, labels)) / len(labels), 4)
+            rows.append(row)
+            print(f"{name:>10} | batch {batch_size:>3} | p50 {row['p50_ms']:>8.2f} ms | p99 {row['p99_ms']:>8.2f} ms"
+                  f" | {row['texts_per_sec']:>8.1f} texts/s | agreement vs {backends[0]}: {row['agreement'] * 100:.1f}%")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
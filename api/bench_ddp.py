@@ -0,0 +1,66 @@
+"""MNIST 데이터 병렬 학습 스케일링 벤치마크 (gloo, 단일 호스트)
+
+사용 예:
+    python bench_ddp.py --procs 1,2,4,8 --batch-size 64 --steps 200 --json ddp.json
+
+rank 수마다 ddp_training.run_distributed_training 을 epoch 한 번(--steps 스텝) 돌려서
+전체 처리량(samples/sec), rank 당 처리량, 스케일링 효율을 출력합니다.
+스케일링 효율 = N rank 처리량 / (N x 1 rank 처리량) 이고, 1.0 이면 선형으로 늘어난 것입니다.
+batch_size 는 rank 하나의 배치 크기라서 rank 가 늘면 한 스텝의 전체 배치도 같이 커집니다.
+"""
+import argparse
+import json
+import os
+
+from ddp_training import run_distributed_training
+
+
+def run_once(nproc, args):
+    events = []
+    run_distributed_training(
+        epochs=1, batch_size=args.batch_size, lr=0.01, report=events.append, should_stop=lambda: False,
+        nproc_per_node=nproc, fast_pipeline=not args.slow_pipeline, metrics_every=0,
+        max_steps_per_epoch=args.steps, save_checkpoint=False,
+    )
+    progress = [e for e in events if e["type"] == "progress"]
+    return progress[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MNIST data-parallel training scaling benchmark")
+    parser.add_argument("--procs", default="1,2,4", help="비교할 rank 수 목록 (첫 값이 기준)")
+    parser.add_argument("--batch-size", type=int, default=64, help="rank 하나의 배치 크기")
+    parser.add_argument("--steps", type=int, default=200, help="rank 마다 돌릴 스텝 수")
+    parser.add_argument("--slow-pipeline", action="store_true", help="텐서 캐시 대신 torchvision 변환 로더 사용")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args()
+
+    procs = [int(p) for p in args.procs.split(",") if p.strip()]
+    print(f"cpu_count={os.cpu_count()}  batch/rank={args.batch_size}  steps={args.steps}")
+
+    rows = []
+    baseline = None
+    for nproc in procs:
+        result = run_once(nproc, args)
+        per_rank = result["samples_per_sec"] / nproc
+        if baseline is None:
+            baseline = per_rank      # 첫 rank 수의 rank 당 처리량
+        row = {
+            "procs": nproc,
+            "samples_per_sec": result["samples_per_sec"],
+            "samples_per_sec_per_rank": round(per_rank, 1),
+            "epoch_seconds": result["epoch_seconds"],
+            "speedup": round(result["samples_per_sec"] / (baseline * procs[0]), 3),
+            "efficiency": round(per_rank / baseline, 3),
+        }
+        rows.append(row)
+        print(f"{nproc:>3} ranks | {row['samples_per_sec']:>10.1f} samples/s | {row['samples_per_sec_per_rank']:>9.1f} /rank"
+              f" | speedup {row['speedup']:>5.2f}x | efficiency {row['efficiency'] * 100:>5.1f}%")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
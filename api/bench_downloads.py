@@ -0,0 +1,177 @@
+"""파일 다운로드 처리량 벤치마크
+
+사용 예:
+    python bench_downloads.py --size-mb 512 --clients 1,8,32 --requests 64 --mode full,range
+
+임시 폴더에 SQLite DB 와 저장소를 만들고 --size-mb 크기의 파일을 blob 으로 등록한 뒤,
+uvicorn 으로 서버를 띄워 여러 클라이언트가 동시에 내려받게 합니다.
+mode=full 은 파일 전체, mode=range 는 --range-mb 크기의 무작위 구간을 요청합니다.
+요청당 지연시간 p50/p99 와 전체 처리량(MB/s) 을 출력합니다.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+READ_BYTES = 1024 * 1024
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def seed_storage(workdir, size_mb):
+    """임시 DB/저장소에 모델 하나와 size_mb 크기의 weights 파일을 등록합니다."""
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{workdir}/bench.db", "STORAGE_ROOT": f"{workdir}/storage"}
+    script = f"""
+import hashlib, os
+from database import Base, SessionLocal, engine, AIModel
+from migrations import run_migrations
+from blobs import BLOB_TMP_DIR, add_file
+Base.metadata.create_all(bind=engine)
+run_migrations(engine)
+os.makedirs(BLOB_TMP_DIR, exist_ok=True)
+tmp_path = os.path.join(BLOB_TMP_DIR, "bench")
+hasher = hashlib.sha256()
+block = os.urandom({READ_BYTES})
+with open(tmp_path, "wb") as f:
+    for _ in range({size_mb}):
+        f.write(block)
+        hasher.update(block)
+db = SessionLocal()
+db.add(AIModel(name="bench", author="bench", license="mit", tags="", readme="", downloads=0, likes=0))
+db.commit()
+add_file(db, "models", "bench", "weights.bin", hasher.hexdigest(), {size_mb} * {READ_BYTES}, src_path=tmp_path)
+db.close()
+"""
+    api_dir = os.path.dirname(os.path.abspath(__file__))
+    subprocess.run([sys.executable, "-c", script], cwd=api_dir, env=env, check=True, capture_output=True)
+    return env
+
+
+def start_server(env, port):
+    api_dir = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port), "--log-level", "warning"],
+        cwd=api_dir, env={**env, "MODEL_WARMUP": "0"},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/healthz")
+            conn.getresponse().read()
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("server did not start")
+
+
+def fetch(port, headers):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=300)
+    conn.request("GET", "/models/bench/files/weights.bin", headers=headers)
+    res = conn.getresponse()
+    received = 0
+    while True:
+        chunk = res.read(READ_BYTES)
+        if not chunk:
+            break
+        received += len(chunk)
+    conn.close()
+    if res.status not in (200, 206):
+        raise RuntimeError(f"unexpected status {res.status}")
+    return received
+
+
+def run_load(port, clients, requests, mode, file_size, range_bytes, seed):
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(requests):
+        if mode == "range":
+            start = rng.randrange(0, max(1, file_size - range_bytes))
+            jobs.append({"Range": f"bytes={start}-{start + range_bytes - 1}"})
+        else:
+            jobs.append({})
+
+    lock = threading.Lock()
+    latencies, total_bytes = [], [0]
+
+    def worker():
+        while True:
+            with lock:
+                if not jobs:
+                    return
+                headers = jobs.pop()
+            t0 = time.perf_counter()
+            received = fetch(port, headers)
+            elapsed = time.perf_counter() - t0
+            with lock:
+                latencies.append(elapsed)
+                total_bytes[0] += received
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+
+    return {
+        "mode": mode,
+        "clients": clients,
+        "requests": requests,
+        "p50_ms": round(float(np.percentile(latencies, 50)) * 1000.0, 2),
+        "p99_ms": round(float(np.percentile(latencies, 99)) * 1000.0, 2),
+        "mb_per_sec": round(total_bytes[0] / wall / (1024 * 1024), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="File download throughput benchmark")
+    parser.add_argument("--size-mb", type=int, default=256, help="내려받을 파일 크기 (MB)")
+    parser.add_argument("--clients", default="1,8,32", help="동시 클라이언트 수 목록")
+    parser.add_argument("--requests", type=int, default=32, help="설정마다 보낼 요청 수")
+    parser.add_argument("--mode", default="full,range")
+    parser.add_argument("--range-mb", type=int, default=16, help="mode=range 에서 요청할 구간 크기 (MB)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        env = seed_storage(workdir, args.size_mb)
+        port = free_port()
+        proc = start_server(env, port)
+        try:
+            file_size = args.size_mb * READ_BYTES
+            for mode in [m.strip() for m in args.mode.split(",") if m.strip()]:
+                for clients in [int(c) for c in args.clients.split(",")]:
+                    row = run_load(port, clients, args.requests, mode, file_size, args.range_mb * READ_BYTES, args.seed)
+                    rows.append(row)
+                    print(f"{mode:>6} | clients {clients:>3} | p50 {row['p50_ms']:>9.2f} ms | p99 {row['p99_ms']:>9.2f} ms"
+                          f" | {row['mb_per_sec']:>8.1f} MB/s")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""게이트웨이 텔레메트리 벤치마크 (서버 없이 프로세스 안에서)
+
+사용 예:
+    python bench_gateways.py --fleet 1000,10000,50000 --rounds 5 --batch 500
+
+게이트웨이 --fleet 대를 만들고 하트비트를 --batch 개씩 묶어 --rounds 바퀴 넣은 뒤,
+하트비트 처리량(개/초), 요약 조회(/gateways 의 summary) 와 장치 한 페이지 조회 지연시간,
+오프라인 판정 스윕 시간, 시계열이 차지하는 메모리를 출력합니다.
+"""
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+
+from telemetry import GatewayTelemetry
+
+
+def make_batch(rng, ids, uptime):
+    return [{
+        "id": gateway_id,
+        "cpu": rng.uniform(0, 100), "memory": rng.uniform(0, 100), "flash": rng.uniform(0, 100),
+        "sensors": rng.randrange(0, 16), "fw_ver": "1.2.0", "app_ver": "2.0.1",
+        "location": f"{rng.randrange(100, 120)}동", "uptime_seconds": uptime,
+    } for gateway_id in ids]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return round(float(np.percentile(samples, 50)) * 1e6, 1), round(float(np.percentile(samples, 99)) * 1e6, 1)
+
+
+def run(fleet, rounds, batch, seed):
+    rng = random.Random(seed)
+    telemetry = GatewayTelemetry(offline_after_seconds=90)
+    ids = [f"GW-{i:06d}" for i in range(fleet)]
+    now = time.time()
+
+    ingest_seconds, sent = 0.0, 0
+    for r in range(rounds):
+        for start in range(0, fleet, batch):
+            heartbeats = make_batch(rng, ids[start:start + batch], uptime=r * 30)
+            t0 = time.perf_counter()
+            telemetry.ingest(heartbeats, now=now + r * 30)
+            ingest_seconds += time.perf_counter() - t0
+            sent += len(heartbeats)
+
+    summary_p50, summary_p99 = timed(telemetry.summary, 1000)
+    page_p50, page_p99 = timed(lambda: telemetry.devices(offset=fleet // 2, limit=100), 200)
+
+    # 절반이 하트비트를 멈췄다고 보고 오프라인 판정 스윕 시간을 잽니다.
+    later = now + (rounds - 1) * 30
+    telemetry.ingest(make_batch(rng, ids[: fleet // 2], uptime=rounds * 30), now=later + 60)
+    t0 = time.perf_counter()
+    went_offline = telemetry.mark_offline(now=later + 120)
+    sweep_ms = (time.perf_counter() - t0) * 1000.0
+
+    stats = telemetry.stats()
+    return {
+        "fleet": fleet,
+        "heartbeats_per_sec": round(sent / ingest_seconds),
+        "summary_p50_us": summary_p50,
+        "summary_p99_us": summary_p99,
+        "page_p50_us": page_p50,
+        "page_p99_us": page_p99,
+        "sweep_ms": round(sweep_ms, 2),
+        "went_offline": went_offline,
+        "series_mb": round(stats["series_bytes"] / (1024 * 1024), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gateway telemetry ingestion / summary benchmark")
+    parser.add_argument("--fleet", default="1000,10000,50000", help="게이트웨이 수 목록")
+    parser.add_argument("--rounds", type=int, default=5, help="게이트웨이마다 보낼 하트비트 수")
+    parser.add_argument("--batch", type=int, default=500, help="요청 하나에 묶을 하트비트 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args()
+
+    rows = []
+    for fleet in [int(f) for f in args.fleet.split(",")]:
+        row = run(fleet, args.rounds, args.batch, args.seed)
+        rows.append(row)
+        print(f"fleet {fleet:>7} | {row['heartbeats_per_sec']:>8} hb/s"
+              f" | summary p50 {row['summary_p50_us']:>6.1f} us p99 {row['summary_p99_us']:>6.1f} us"
+              f" | page p50 {row['page_p50_us']:>8.1f} us | sweep {row['sweep_ms']:>7.2f} ms"
+              f" ({row['went_offline']} offline) | {row['series_mb']:>6.1f} MB")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""프로세스 시작 속도 측정 (회귀 추적용)
+
+사용 예:
+    python bench_startup.py --runs 5 --max-database-ms 1000
+
+새 파이썬 프로세스에서 database / server 모듈을 import 하는 데 걸리는 시간을
+여러 번 재서 중앙값을 출력합니다. --max-*-ms 를 넘기면 종료 코드 1 로 끝나므로
+CI 에서 회귀 체크용으로 쓸 수 있습니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ("database", "server")
+
+SNIPPET = """
+import time
+t0 = time.perf_counter()
+import {module}
+print(time.perf_counter() - t0)
+"""
+
+
+def measure(module, runs):
+    api_dir = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", SNIPPET.format(module=module)],
+            cwd=api_dir, capture_output=True, text=True, check=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]) * 1000.0)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Module import time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    for module in MODULES:
+        parser.add_argument(f"--max-{module}-ms", type=float, help=f"{module} import 중앙값 상한 (ms)")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장할 경로")
+    args = parser.parse_args()
+
+    results = {}
+    failed = False
+    for module in MODULES:
+        samples = measure(module, args.runs)
+        median = statistics.median(samples)
+        results[module] = {"median_ms": round(median, 1), "min_ms": round(min(samples), 1), "max_ms": round(max(samples), 1)}
+        limit = getattr(args, f"max_{module}_ms")
+        verdict = ""
+        if limit is not None:
+            ok = median <= limit
+            failed = failed or not ok
+            verdict = f" (limit {limit:.0f} ms: {'OK' if ok else 'FAIL'})"
+        print(f"import {module:<10} median {median:8.1f} ms | min {min(samples):8.1f} ms | max {max(samples):8.1f} ms{verdict}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
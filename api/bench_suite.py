@@ -0,0 +1,303 @@
+"""API 부하 테스트 / 회귀 확인용 벤치마크 모음
+
+사용 예:
+    python bench_suite.py --save-baseline baseline.json                  # 기준 결과 저장
+    python bench_suite.py --baseline baseline.json --threshold 0.15      # 기준보다 나빠지면 종료 코드 1
+    python bench_suite.py --scenarios models,comments,download --clients 1,16 --requests 500
+
+한 대의 장비 안에서 끝납니다. 임시 폴더에 SQLite DB 와 저장소(storage) 를 만들고
+모델/데이터셋 --repos 개씩, 저장소마다 --files 개의 파일(--file-kb) 과 --comments 개의 댓글을 넣은 뒤,
+uvicorn 으로 서버를 띄워 시나리오별로 --clients 동시성마다 --requests 개의 요청을 보냅니다.
+시나리오별 처리량(req/s) 과 p50/p95/p99 지연시간, 오류 수를 출력합니다.
+
+--baseline 을 주면 (시나리오, 동시성) 마다 p95 가 threshold 비율 넘게 늘거나 처리량이 그만큼 줄면
+회귀로 보고 종료 코드 1 로 끝납니다. (--min-delta-ms 보다 작은 지연시간 차이는 무시)
+predict 시나리오는 감성 분석 모델을 실제로 불러오므로, --model-timeout 안에 준비되지 않으면 건너뜁니다.
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+SCENARIOS = ("predict", "models", "datasets", "comments", "upload", "download")
+SAMPLE_TEXTS = [
+    "I love this product, it works perfectly!",
+    "Terrible experience, it broke after two days.",
+    "배송도 빠르고 품질도 아주 좋아요.",
+    "생각보다 별로네요. 다시는 안 살 것 같아요.",
+    "Not bad for the price, but the battery life could be better.",
+    "Absolutely fantastic, exceeded all my expectations.",
+]
+BOUNDARY = "bench-suite-boundary"
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def seed(env, repos, files, file_kb, comments, seed_value):
+    """모델/데이터셋, 파일(blob), 댓글을 임시 DB/저장소에 넣습니다."""
+    script = f"""
+import hashlib, os, random
+from database import Base, SessionLocal, engine, AIModel, Dataset
+from migrations import run_migrations
+from blobs import BLOB_TMP_DIR, add_file
+from comments import add_comment
+from storage import refresh_storage_stats
+Base.metadata.create_all(bind=engine)
+run_migrations(engine)
+os.makedirs(BLOB_TMP_DIR, exist_ok=True)
+rng = random.Random({seed_value})
+db = SessionLocal()
+for kind, table, target_type in (("models", AIModel, "model"), ("datasets", Dataset, "dataset")):
+    for i in range({repos}):
+        name = f"bench-{{i}}"
+        db.add(table(name=name, author=f"user{{i % 20}}", license="mit", tags="bench,nlp",
+                     readme="benchmark row", downloads=rng.randrange(1000), likes=rng.randrange(100)))
+        db.commit()
+        for j in range({files}):
+            data = rng.randbytes({file_kb} * 1024)
+            tmp_path = os.path.join(BLOB_TMP_DIR, f"seed-{{kind}}-{{i}}-{{j}}")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            add_file(db, kind, name, f"file-{{j}}.bin", hashlib.sha256(data).hexdigest(), len(data), src_path=tmp_path)
+        refresh_storage_stats(db, kind, name)
+        db.commit()
+        for k in range({comments}):
+            add_comment(db, target_type, name, f"user{{k % 20}}", f"comment {{k}} on {{name}}")
+db.close()
+"""
+    api_dir = os.path.dirname(os.path.abspath(__file__))
+    subprocess.run([sys.executable, "-c", script], cwd=api_dir, env=env, check=True, capture_output=True)
+
+
+def start_server(env, port, timeout=60):
+    api_dir = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port), "--log-level", "warning"],
+        cwd=api_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/healthz")
+            conn.getresponse().read()
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("server did not start")
+
+
+def wait_for_model(port, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        conn.request("GET", "/readyz")
+        res = conn.getresponse()
+        body = json.loads(res.read())
+        conn.close()
+        if res.status == 200:
+            return True
+        if body.get("status") == "error":
+            return False
+        time.sleep(1)
+    return False
+
+
+def multipart(filename, data):
+    head = (f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"files\"; filename=\"{filename}\"\r\n"
+            f"Content-Type: application/octet-stream\r\n\r\n").encode()
+    return head + data + f"\r\n--{BOUNDARY}--\r\n".encode(), {"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+def build_requests(scenario, count, args, rng):
+    """(method, path, body, headers) 목록. 같은 seed 면 같은 요청 순서가 나옵니다."""
+    repo = lambda: f"bench-{rng.randrange(args.repos)}"
+    payloads = [rng.randbytes(args.upload_kb * 1024) for _ in range(4)] if scenario == "upload" else []
+    requests = []
+    for i in range(count):
+        if scenario == "predict":
+            body = json.dumps({"text": f"{rng.choice(SAMPLE_TEXTS)} #{rng.randrange(args.distinct_texts)}"}).encode()
+            requests.append(("POST", "/predict", body, {"Content-Type": "application/json"}))
+        elif scenario in ("models", "datasets"):
+            sort = rng.choice(["recent", "likes", "downloads"])
+            requests.append(("GET", f"/{scenario}?limit=50&sort={sort}", None, {}))
+        elif scenario == "comments":
+            target_type = rng.choice(["model", "dataset"])
+            requests.append(("GET", f"/comments/{target_type}/{repo()}?limit=20", None, {}))
+        elif scenario == "upload":
+            body, headers = multipart(f"upload-{i % 8}.bin", rng.choice(payloads))
+            requests.append(("POST", f"/models/{repo()}/upload", body, headers))
+        elif scenario == "download":
+            kind = rng.choice(["models", "datasets"])
+            requests.append(("GET", f"/{kind}/{repo()}/files/file-{rng.randrange(args.files)}.bin", None, {}))
+    return requests
+
+
+def run_load(port, clients, requests):
+    pending = list(reversed(requests))
+    lock = threading.Lock()
+    latencies, errors = [], [0]
+
+    def worker():
+        # 클라이언트마다 keep-alive 연결 하나를 계속 씁니다.
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+        while True:
+            with lock:
+                if not pending:
+                    break
+                method, path, body, headers = pending.pop()
+            t0 = time.perf_counter()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                res = conn.getresponse()
+                res.read()
+                ok = res.status < 400
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+                ok = False
+            elapsed = time.perf_counter() - t0
+            with lock:
+                latencies.append(elapsed)
+                if not ok:
+                    errors[0] += 1
+        conn.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+    ms = lambda p: round(float(np.percentile(latencies, p)) * 1000.0, 2)
+    return {
+        "clients": clients,
+        "requests": len(requests),
+        "req_per_sec": round(len(requests) / wall, 1),
+        "p50_ms": ms(50),
+        "p95_ms": ms(95),
+        "p99_ms": ms(99),
+        "errors": errors[0],
+    }
+
+
+def compare(rows, baseline, threshold, min_delta_ms):
+    """기준 결과 대비 회귀 목록 (사람이 읽을 문장)."""
+    base = {(r["scenario"], r["clients"]): r for r in baseline["results"]}
+    regressions = []
+    for row in rows:
+        old = base.get((row["scenario"], row["clients"]))
+        if old is None:
+            continue
+        label = f"{row['scenario']} @ {row['clients']} clients"
+        if row["p95_ms"] > old["p95_ms"] * (1 + threshold) and row["p95_ms"] - old["p95_ms"] > min_delta_ms:
+            regressions.append(f"{label}: p95 {old['p95_ms']} -> {row['p95_ms']} ms")
+        if row["req_per_sec"] < old["req_per_sec"] * (1 - threshold):
+            regressions.append(f"{label}: throughput {old['req_per_sec']} -> {row['req_per_sec']} req/s")
+        if row["errors"] > old["errors"]:
+            regressions.append(f"{label}: errors {old['errors']} -> {row['errors']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API load test / regression benchmark suite")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"쉼표로 구분 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--clients", default="1,8,32", help="동시 클라이언트 수 목록")
+    parser.add_argument("--requests", type=int, default=300, help="(시나리오, 동시성) 마다 보낼 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전에 버리는 요청 수")
+    parser.add_argument("--repos", type=int, default=50, help="모델/데이터셋 각각의 개수")
+    parser.add_argument("--files", type=int, default=3, help="저장소마다 파일 수")
+    parser.add_argument("--file-kb", type=int, default=256, help="seed 파일 크기 (KB)")
+    parser.add_argument("--upload-kb", type=int, default=1024, help="upload 시나리오의 파일 크기 (KB)")
+    parser.add_argument("--comments", type=int, default=30, help="저장소마다 댓글 수")
+    parser.add_argument("--distinct-texts", type=int, default=1000, help="predict 문장 종류 수 (캐시 적중률 조절)")
+    parser.add_argument("--model-timeout", type=float, default=300, help="predict 용 모델 준비 대기 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="이번 결과를 JSON 파일로 저장할 경로")
+    parser.add_argument("--save-baseline", help="이번 결과를 기준(baseline) 으로 저장할 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.15, help="허용하는 악화 비율 (0.15 = 15%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="이보다 작은 p95 차이는 회귀로 보지 않음")
+    args = parser.parse_args()
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    client_levels = [int(c) for c in args.clients.split(",")]
+
+    rows, skipped = [], []
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{workdir}/bench.db",
+            "STORAGE_ROOT": f"{workdir}/storage",
+            "MODEL_WARMUP": "1" if "predict" in scenarios else "0",
+            # 다운로드 수는 벤치마크 중에 DB 로 자주 반영되지 않게 합니다.
+            "DOWNLOAD_FLUSH_SECONDS": "60",
+        }
+        print(f"seeding {args.repos} models/datasets x {args.files} files ({args.file_kb} KB), {args.comments} comments each...")
+        seed(env, args.repos, args.files, args.file_kb, args.comments, args.seed)
+        port = free_port()
+        proc = start_server(env, port)
+        try:
+            for scenario in scenarios:
+                if scenario == "predict" and not wait_for_model(port, args.model_timeout):
+                    skipped.append(scenario)
+                    print(f"{scenario:>9} | skipped (model not ready)")
+                    continue
+                for clients in client_levels:
+                    rng = random.Random(f"{args.seed}-{scenario}-{clients}")
+                    if args.warmup:
+                        run_load(port, clients, build_requests(scenario, args.warmup, args, rng))
+                    row = {"scenario": scenario, **run_load(port, clients, build_requests(scenario, args.requests, args, rng))}
+                    rows.append(row)
+                    print(f"{scenario:>9} | clients {clients:>3} | {row['req_per_sec']:>8.1f} req/s"
+                          f" | p50 {row['p50_ms']:>8.2f} | p95 {row['p95_ms']:>8.2f} | p99 {row['p99_ms']:>8.2f} ms"
+                          f" | errors {row['errors']}")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "host": {"platform": platform.platform(), "python": platform.python_version(), "cpus": os.cpu_count()},
+        "config": {k: v for k, v in vars(args).items() if k not in ("json", "save_baseline", "baseline")},
+        "skipped": skipped,
+        "results": rows,
+    }
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(rows, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) vs {args.baseline} (threshold {args.threshold:.0%}):")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\n✅ no regressions vs {args.baseline} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
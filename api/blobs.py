@@ -0,0 +1,195 @@
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from database import AIModel, Blob, Dataset, RepoFile
+from storage import STORAGE_ROOT, UPLOAD_TEMP_PREFIX, repo_dir
+
+# ==========================================
+# 내용 주소 저장소 (blob = SHA-256 으로 식별되는 파일 내용)
+# ==========================================
+# 실제 내용은 STORAGE_ROOT/.blobs/ab/cdef... 에 한 번만 저장하고, repo_files 테이블(매니페스트)이
+# 저장소별 "파일 이름 -> 해시" 를 기록합니다. blobs.refcount 는 그 blob 을 가리키는 매니페스트 행 수이고,
+# 0 이 되면 blob 파일을 지웁니다.
+# ./storage/{kind}/{name}/ 폴더는 blob 을 가리키는 하드링크로만 채워서(안 되면 복사) 용량 집계 등
+# 폴더를 보는 기존 코드도 그대로 동작하게 합니다.
+BLOB_ROOT = os.path.join(STORAGE_ROOT, ".blobs")
+BLOB_TMP_DIR = os.path.join(BLOB_ROOT, "tmp")
+HASH_READ_BYTES = 1024 * 1024
+
+# 같은 프로세스 안에서 "참조 수 증가 + blob 배치" 와 "참조 0 인 blob 삭제" 가 엇갈리지 않도록 합니다.
+_blob_lock = threading.Lock()
+
+
+class BlobNotFound(Exception):
+    pass
+
+
+def blob_path(sha256):
+    return os.path.join(BLOB_ROOT, sha256[:2], sha256[2:])
+
+
+def hash_file(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_READ_BYTES), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def _discard(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def blob_exists(db, sha256):
+    blob = db.get(Blob, sha256.lower())
+    return blob is not None and os.path.exists(blob_path(blob.sha256))
+
+
+def _place_blob(sha256, src_path):
+    """src_path 를 blob 으로 옮깁니다. 이미 같은 내용이 있으면 src_path 는 버립니다."""
+    path = blob_path(sha256)
+    if os.path.exists(path):
+        if src_path:
+            _discard(src_path)
+        return
+    if not src_path:
+        raise BlobNotFound(sha256)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(src_path, path)
+
+
+def _link_view(kind, name, filename, sha256):
+    target_dir = repo_dir(kind, name)
+    os.makedirs(target_dir, exist_ok=True)
+    tmp_path = os.path.join(target_dir, f"{UPLOAD_TEMP_PREFIX}{uuid.uuid4().hex[:8]}-{filename}")
+    try:
+        os.link(blob_path(sha256), tmp_path)
+    except OSError:
+        shutil.copyfile(blob_path(sha256), tmp_path)
+    os.replace(tmp_path, os.path.join(target_dir, filename))
+
+
+def _incref(db, sha256, size):
+    updated = db.execute(
+        update(Blob).where(Blob.sha256 == sha256).values(refcount=Blob.refcount + 1)
+    ).rowcount
+    if updated:
+        return
+    try:
+        with db.begin_nested():
+            db.add(Blob(sha256=sha256, size=size, refcount=1))
+    except IntegrityError:
+        # _blob_lock 은 프로세스 안에서만 막으므로, 다른 워커가 같은 내용을 먼저 등록했으면 참조만 올립니다.
+        _incref(db, sha256, size)
+
+
+def _decref(db, sha256):
+    db.execute(update(Blob).where(Blob.sha256 == sha256).values(refcount=Blob.refcount - 1))
+
+
+def _collect(db, candidates):
+    # 참조가 0 이 된 blob 행을 지우고 commit 한 뒤 파일을 지웁니다. (_blob_lock 을 잡은 상태에서 호출)
+    removed = []
+    for sha256 in set(candidates):
+        if db.query(Blob).filter(Blob.sha256 == sha256, Blob.refcount <= 0).delete(synchronize_session=False):
+            removed.append(sha256)
+    db.commit()
+    for sha256 in removed:
+        _discard(blob_path(sha256))
+    return removed
+
+
+def add_file(db, kind, name, filename, sha256, size=None, src_path=None):
+    """저장소 매니페스트에 filename -> sha256 을 기록하고 commit 합니다.
+
+    src_path 는 해시를 이미 확인한 임시 파일로, 같은 blob 이 없을 때만 옮겨지고 있으면 버려집니다.
+    src_path 없이 부르면 이미 있는 blob 만 연결하며, 없으면 BlobNotFound 를 던집니다.
+    같은 이름의 기존 파일은 교체되고, 더 이상 참조되지 않는 옛 blob 은 지워집니다.
+    """
+    sha256 = sha256.lower()
+    with _blob_lock:
+        if src_path is None:
+            blob = db.get(Blob, sha256)
+            if blob is None or not os.path.exists(blob_path(sha256)):
+                raise BlobNotFound(sha256)
+            size = blob.size
+        entry = db.query(RepoFile).filter(
+            RepoFile.kind == kind, RepoFile.repo_name == name, RepoFile.filename == filename
+        ).first()
+        old_sha256 = entry.sha256 if entry else None
+        if old_sha256 != sha256:
+            _incref(db, sha256, size)
+            if entry is None:
+                db.add(RepoFile(kind=kind, repo_name=name, filename=filename, sha256=sha256, size=size))
+            else:
+                _decref(db, old_sha256)
+                entry.sha256, entry.size, entry.updated_at = sha256, size, datetime.utcnow()
+        db.commit()
+        _place_blob(sha256, src_path)
+        _link_view(kind, name, filename, sha256)
+        if old_sha256 and old_sha256 != sha256:
+            _collect(db, [old_sha256])
+    return {"name": filename, "size": size, "sha256": sha256}
+
+
+def remove_repo(db, kind, name):
+    """저장소의 매니페스트를 모두 지우고, 다른 곳에서 참조하지 않는 blob 만 삭제합니다. 지운 blob 수를 돌려줍니다."""
+    with _blob_lock:
+        entries = db.query(RepoFile).filter(RepoFile.kind == kind, RepoFile.repo_name == name).all()
+        for entry in entries:
+            _decref(db, entry.sha256)
+            db.delete(entry)
+        removed = _collect(db, [e.sha256 for e in entries])
+    shutil.rmtree(repo_dir(kind, name), ignore_errors=True)
+    return len(removed)
+
+
+def list_files(db, kind, name):
+    return db.query(RepoFile).filter(RepoFile.kind == kind, RepoFile.repo_name == name).order_by(RepoFile.filename).all()
+
+
+def get_file(db, kind, name, filename):
+    return db.query(RepoFile).filter(
+        RepoFile.kind == kind, RepoFile.repo_name == name, RepoFile.filename == filename
+    ).first()
+
+
+def adopt_untracked_files(db):
+    """매니페스트에 없는 저장소 폴더 속 일반 파일(예전 방식으로 올린 파일)을 blob 으로 옮겨 등록합니다."""
+    adopted = 0
+    for kind, table in (("models", AIModel), ("datasets", Dataset)):
+        try:
+            repos = [e.name for e in os.scandir(os.path.join(STORAGE_ROOT, kind)) if e.is_dir()]
+        except FileNotFoundError:
+            continue
+        existing = {name for (name,) in db.query(table.name).filter(table.name.in_(repos))} if repos else set()
+        for name in repos:
+            if name not in existing:
+                # DB 에 없는 저장소의 폴더는 remove_repo 로 지울 수 없으므로 blob 참조를 만들지 않습니다.
+                print(f"⚠️ DB 에 없는 {kind} 폴더는 건너뜁니다: {repo_dir(kind, name)}")
+                continue
+            known = {row.filename for row in list_files(db, kind, name)}
+            for entry in os.scandir(repo_dir(kind, name)):
+                if not entry.is_file() or entry.name in known or entry.name.startswith(UPLOAD_TEMP_PREFIX):
+                    continue
+                sha256 = hash_file(entry.path)
+                os.makedirs(BLOB_TMP_DIR, exist_ok=True)
+                tmp_path = os.path.join(BLOB_TMP_DIR, uuid.uuid4().hex)
+                # 원본 파일을 하드링크로 blob 후보에 걸어 두면 내용 복사 없이 옮겨집니다.
+                try:
+                    os.link(entry.path, tmp_path)
+                except OSError:
+                    shutil.copyfile(entry.path, tmp_path)
+                add_file(db, kind, name, entry.name, sha256, entry.stat().st_size, src_path=tmp_path)
+                adopted += 1
+    return adopted
@@ -0,0 +1,99 @@
+import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+
+def normalize_text(text):
+    # 공백/유니코드 표기만 다른 같은 문장은 같은 키로 취급합니다.
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+# ==========================================
+# 메모리 상한이 있는 LRU + TTL 캐시
+# ==========================================
+class LRUCache:
+    """항목 수와 대략적인 바이트 수 두 가지 상한을 갖는 스레드 안전 LRU 캐시.
+
+    ttl_seconds 가 0 이면 만료 없이 LRU 축출만 일어납니다.
+    """
+
+    def __init__(self, max_entries=10000, max_bytes=64 * 1024 * 1024, ttl_seconds=0):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.ttl = float(ttl_seconds)
+        self._data = OrderedDict()  # key -> (value, size, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _sizeof(key, value):
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        for part in (key if isinstance(key, tuple) else ()):
+            size += sys.getsizeof(part)
+        if isinstance(value, dict):
+            size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+        return size
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, expires_at = entry
+            if expires_at and expires_at < time.monotonic():
+                self._remove(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, size=None):
+        # size 를 주면 그 값(바이트)으로 계산합니다. (텐서처럼 getsizeof 로 잴 수 없는 값)
+        size = self._sizeof(key, value) if size is None else int(size)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size, expires_at)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                old_key, (_, old_size, _) = next(iter(self._data.items()))
+                self._remove(old_key, old_size)
+                self.evictions += 1
+
+    def _remove(self, key, size):
+        del self._data[key]
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,73 @@
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from database import Comment, CommentCount
+from listing import bump_listing_version, paginate
+
+# ==========================================
+# 댓글 (대상별 keyset 페이지네이션 + 댓글 수 카운터)
+# ==========================================
+# 댓글의 target_type 은 "model" / "dataset", target_id 는 모델/데이터셋 이름입니다.
+# 목록 화면에 댓글 수가 나오므로 댓글이 달리면 해당 목록의 버전(ETag) 도 올립니다.
+DEFAULT_COMMENT_PAGE_SIZE = 20
+MAX_COMMENT_PAGE_SIZE = 100
+# 목록 종류 ("models" / "datasets") -> 댓글의 target_type
+COMMENT_TARGET_TYPES = {"models": "model", "datasets": "dataset"}
+LISTING_KINDS = {v: k for k, v in COMMENT_TARGET_TYPES.items()}
+
+
+def list_comments(db, target_type, target_id, cursor=None, limit=DEFAULT_COMMENT_PAGE_SIZE):
+    """최신순 (comments, next_cursor). 잘못된 커서는 ValueError."""
+    limit = max(1, min(limit, MAX_COMMENT_PAGE_SIZE))
+    query = db.query(Comment).filter(Comment.target_type == target_type, Comment.target_id == target_id)
+    return paginate(query, Comment, sort="recent", cursor=cursor, limit=limit)
+
+
+def _increment_count(db, target_type, target_id):
+    updated = db.execute(
+        update(CommentCount)
+        .where(CommentCount.target_type == target_type, CommentCount.target_id == target_id)
+        .values(count=CommentCount.count + 1)
+    ).rowcount
+    if updated:
+        return
+    try:
+        with db.begin_nested():
+            db.add(CommentCount(target_type=target_type, target_id=target_id, count=1))
+    except IntegrityError:
+        # 동시에 첫 댓글이 달려서 다른 요청이 먼저 행을 만들었으면 증가만 합니다.
+        _increment_count(db, target_type, target_id)
+
+
+def add_comment(db, target_type, target_id, username, content):
+    """댓글을 저장하고 카운터를 같은 트랜잭션에서 올립니다. commit 까지 합니다."""
+    comment = Comment(target_type=target_type, target_id=target_id, username=username, content=content)
+    db.add(comment)
+    _increment_count(db, target_type, target_id)
+    if target_type in LISTING_KINDS:
+        bump_listing_version(db, LISTING_KINDS[target_type])
+    db.commit()
+    return comment
+
+
+def get_comment_count(db, target_type, target_id):
+    return db.query(CommentCount.count).filter(
+        CommentCount.target_type == target_type, CommentCount.target_id == target_id
+    ).scalar() or 0
+
+
+def get_comment_counts(db, target_type, target_ids):
+    """대상 여러 개의 댓글 수를 한 번의 쿼리로 가져옵니다. {target_id: count}"""
+    if not target_ids:
+        return {}
+    rows = db.query(CommentCount.target_id, CommentCount.count).filter(
+        CommentCount.target_type == target_type, CommentCount.target_id.in_(list(target_ids))
+    ).all()
+    return dict(rows)
+
+
+def delete_comments(db, target_type, target_id):
+    db.query(Comment).filter(Comment.target_type == target_type, Comment.target_id == target_id).delete(synchronize_session=False)
+    db.query(CommentCount).filter(
+        CommentCount.target_type == target_type, CommentCount.target_id == target_id
+    ).delete(synchronize_session=False)
@@ -0,0 +1,85 @@
+import threading
+from collections import Counter
+
+from sqlalchemy import bindparam, update
+
+from database import AIModel, Dataset
+from listing import bump_listing_version
+
+# ==========================================
+# 다운로드 수 버퍼: 메모리에 모았다가 주기적으로 한 번에 DB 반영
+# ==========================================
+# 파일 다운로드 요청은 increment() 만 하고 바로 응답합니다. flush() 는
+# "downloads = downloads + n" 을 종류별로 묶어서 실행하므로 동시 요청에도 유실이 없습니다.
+COUNTER_TABLES = {"models": AIModel, "datasets": Dataset}
+
+
+class DownloadCounter:
+    def __init__(self, session_factory, flush_interval=5.0):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = Counter()  # (kind, name) -> n
+        self._stop = threading.Event()
+        self._thread = None
+
+    def increment(self, kind, name, n=1):
+        with self._lock:
+            self._pending[(kind, name)] += n
+
+    def pending(self, kind, name):
+        with self._lock:
+            return self._pending.get((kind, name), 0)
+
+    def flush(self):
+        """버퍼를 DB 에 반영하고 갱신한 (kind, name) 개수를 돌려줍니다. 실패하면 버퍼로 되돌립니다."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, Counter()
+            if not batch:
+                return 0
+
+            db = self.session_factory()
+            try:
+                for kind, table in COUNTER_TABLES.items():
+                    rows = [{"b_name": name, "b_n": n} for (k, name), n in batch.items() if k == kind]
+                    if not rows:
+                        continue
+                    stmt = (
+                        update(table.__table__)
+                        .where(table.__table__.c.name == bindparam("b_name"))
+                        .values(downloads=table.__table__.c.downloads + bindparam("b_n"))
+                    )
+                    db.execute(stmt, rows)
+                    bump_listing_version(db, kind)
+                db.commit()
+            except Exception:
+                db.rollback()
+                with self._lock:
+                    self._pending.update(batch)
+                raise
+            finally:
+                db.close()
+            return len(batch)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="download-counter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"❌ Download counter flush failed: {e}")
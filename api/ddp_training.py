@@ -0,0 +1,285 @@
+"""MNIST 데이터 병렬 학습 (torch.distributed + gloo)
+
+서버의 학습 작업(nproc_per_node > 1 또는 nnodes > 1)은 작업자 프로세스 안에서
+run_distributed_training 을 호출하고, 이 함수가 로컬 rank 프로세스들을 띄웁니다.
+
+여러 호스트에 걸쳐 돌릴 때는 서버가 node 0(master) 이 되고, 나머지 호스트에서는
+같은 학습 인자로 이 파일을 직접 실행해서 합류합니다.
+
+사용 예 (두 번째 호스트):
+    python ddp_training.py --nnodes 2 --node-rank 1 --master-addr 10.0.0.5 --master-port 29500 \\
+        --nproc-per-node 8 --epochs 3 --batch-size 64 --fast-pipeline
+"""
+import argparse
+import multiprocessing as mp
+import os
+import queue
+import socket
+import time
+from datetime import datetime, timedelta
+
+import torch
+import torch.distributed as dist
+import torch.nn as nn
+import torch.optim as optim
+from torch.nn.parallel import DistributedDataParallel
+from torch.utils.data import BatchSampler, DataLoader
+from torch.utils.data.distributed import DistributedSampler
+from torchvision import datasets, transforms
+
+from training import (DATA_DIR, MNIST_MEAN, MNIST_STD, TensorBatchDataset, TrainingCancelled,
+                      build_mnist_model, load_cached_mnist, save_mnist_checkpoint)
+
+# ==========================================
+# 데이터 병렬 학습 - rank 마다 데이터 조각(shard) 하나, 그래디언트는 all-reduce
+# ==========================================
+# batch_size 는 rank 하나의 배치 크기입니다. (한 스텝의 전체 배치 = batch_size x world_size)
+# 취소 신호는 STOP_CHECK_EVERY 스텝마다 all-reduce 로 모든 rank 에 퍼뜨려, 전부 같은 스텝에서 멈춥니다.
+# 체크포인트 저장과 진행 상황 보고는 rank 0 만 합니다.
+DDP_BACKEND = "gloo"
+STOP_CHECK_EVERY = 10
+DDP_TIMEOUT_SECONDS = int(os.getenv("DDP_TIMEOUT_SECONDS", "300"))
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("", 0))
+        return s.getsockname()[1]
+
+
+def prepare_mnist(fast_pipeline):
+    # rank 들이 동시에 내려받거나 캐시 파일을 만들지 않도록 띄우기 전에 한 번 준비합니다.
+    if fast_pipeline:
+        load_cached_mnist()
+    else:
+        datasets.MNIST(DATA_DIR, train=True, download=True)
+
+
+def build_distributed_loader(batch_size, fast_pipeline, num_workers, rank, world_size):
+    if fast_pipeline:
+        dataset = TensorBatchDataset(*load_cached_mnist())
+        sampler = DistributedSampler(dataset, num_replicas=world_size, rank=rank, shuffle=True)
+        loader = DataLoader(dataset, sampler=BatchSampler(sampler, batch_size=batch_size, drop_last=False),
+                            batch_size=None, num_workers=num_workers, persistent_workers=num_workers > 0)
+        return loader, sampler
+    transform = transforms.Compose([
+        transforms.ToTensor(),
+        transforms.Normalize((MNIST_MEAN,), (MNIST_STD,))
+    ])
+    dataset = datasets.MNIST(DATA_DIR, train=True, download=False, transform=transform)
+    sampler = DistributedSampler(dataset, num_replicas=world_size, rank=rank, shuffle=True)
+    return DataLoader(dataset, batch_size=batch_size, sampler=sampler, num_workers=num_workers), sampler
+
+
+# ------------------------------------------
+# rank 프로세스
+# ------------------------------------------
+def _rank_main(local_rank, config, events, stop_event):
+    rank = config["node_rank"] * config["nproc_per_node"] + local_rank
+    torch.set_num_threads(config["threads"])
+    try:
+        dist.init_process_group(
+            DDP_BACKEND, init_method=f"tcp://{config['master_addr']}:{config['master_port']}",
+            rank=rank, world_size=config["world_size"], timeout=timedelta(seconds=DDP_TIMEOUT_SECONDS),
+        )
+    except Exception as e:
+        events.put({"type": "rank_failed", "rank": rank, "error": f"init_process_group: {e}"})
+        return
+    try:
+        _train(rank, config, events, stop_event)
+    except TrainingCancelled:
+        pass
+    except Exception as e:
+        events.put({"type": "rank_failed", "rank": rank, "error": str(e)})
+    finally:
+        dist.destroy_process_group()
+
+
+def _train(rank, config, events, stop_event):
+    world_size, epochs = config["world_size"], config["epochs"]
+    is_main = rank == 0
+
+    def report(event):
+        if is_main:
+            events.put(event)
+
+    def log(message):
+        report({"type": "log", "message": f"[{datetime.now().time()}] {message}"})
+
+    train_loader, sampler = build_distributed_loader(
+        config["batch_size"], config["fast_pipeline"], config["num_workers"], rank, world_size)
+    log(f"Dataset Loaded. Batch Size: {config['batch_size']} x {world_size} ranks, "
+        f"{len(train_loader)} steps/epoch, {config['threads']} threads/rank")
+
+    # 초기 가중치는 DDP 가 rank 0 의 것을 모든 rank 에 broadcast 합니다.
+    model = DistributedDataParallel(build_mnist_model())
+    optimizer = optim.SGD(model.parameters(), lr=config["lr"])
+    criterion = nn.CrossEntropyLoss()
+    metrics_every, max_steps = config["metrics_every"], config["max_steps_per_epoch"]
+    stop_flag = torch.zeros(1)
+
+    model.train()
+    global_step = 0
+    for epoch in range(1, epochs + 1):
+        sampler.set_epoch(epoch)
+        # 손실 합/정답 수는 텐서에 누적하고, epoch 끝에서 [손실 합, 정답 수, 샘플 수] 를 한 번만 all-reduce 합니다.
+        epoch_loss = torch.zeros((), dtype=torch.float64)
+        correct = torch.zeros((), dtype=torch.long)
+        total = 0
+        epoch_started = time.perf_counter()
+        window_started, window_samples = epoch_started, 0
+
+        for batch_idx, (data, target) in enumerate(train_loader):
+            if max_steps and batch_idx >= max_steps:
+                break
+            if batch_idx % STOP_CHECK_EVERY == 0:
+                stop_flag.fill_(1.0 if stop_event.is_set() else 0.0)
+                dist.all_reduce(stop_flag, op=dist.ReduceOp.MAX)
+                if stop_flag.item():
+                    raise TrainingCancelled()
+
+            optimizer.zero_grad()
+            output = model(data)
+            loss = criterion(output, target)
+            loss.backward()      # 여기서 버킷 단위로 그래디언트 all-reduce 가 겹쳐 돌아갑니다.
+            optimizer.step()
+
+            epoch_loss += loss.detach() * target.size(0)
+            correct += output.argmax(dim=1).eq(target).sum()
+            total += target.size(0)
+            global_step += 1
+            window_samples += target.size(0)
+
+            if is_main and metrics_every and global_step % metrics_every == 0:
+                # 스트리밍용 스텝 지표 (여기서만 loss 값을 꺼내므로 metrics_every 스텝당 한 번 동기화)
+                # 모든 rank 가 매 스텝 동기화되므로 rank 0 처리량 x world_size 가 전체 처리량입니다.
+                now = time.perf_counter()
+                report({
+                    "type": "metrics", "epoch": epoch, "step": global_step,
+                    "loss": round(loss.item(), 4),
+                    "samples_per_sec": round(window_samples * world_size / (now - window_started), 1),
+                })
+                window_started, window_samples = now, 0
+
+        totals = torch.stack([epoch_loss, correct.to(torch.float64), torch.tensor(total, dtype=torch.float64)])
+        dist.all_reduce(totals)
+        epoch_seconds = time.perf_counter() - epoch_started
+        loss_sum, correct, total = totals.tolist()
+        samples_per_sec = total / epoch_seconds
+        log(f"Epoch {epoch}/{epochs} - Loss: {loss_sum / total:.4f} - Acc: {100. * correct / total:.2f}% - "
+            f"{samples_per_sec:.0f} samples/s ({samples_per_sec / world_size:.0f}/rank)")
+        report({
+            "type": "progress", "epoch": epoch, "progress": int((epoch / epochs) * 100),
+            "samples_per_sec": round(samples_per_sec, 1), "epoch_seconds": round(epoch_seconds, 3),
+            "world_size": world_size, "samples_per_sec_per_rank": round(samples_per_sec / world_size, 1),
+        })
+
+    if is_main and config["save_checkpoint"]:
+        version, save_path = save_mnist_checkpoint(model.module.state_dict())
+        log(f"Model saved to {save_path} (version {version})")
+
+
+# ------------------------------------------
+# 로컬 rank 들을 띄우고 이벤트를 중계하는 쪽 (학습 작업 프로세스 / 합류용 CLI)
+# ------------------------------------------
+def run_distributed_training(epochs, batch_size, lr, report, should_stop,
+                             nproc_per_node=2, nnodes=1, node_rank=0, master_addr="127.0.0.1", master_port=0,
+                             fast_pipeline=False, num_workers=0, metrics_every=50, max_steps_per_epoch=None,
+                             save_checkpoint=True):
+    """MNIST 분류기를 nproc_per_node x nnodes 개의 rank 로 데이터 병렬 학습합니다.
+
+    report / should_stop 은 run_real_training 과 같습니다. master_port=0 이면 (단일 호스트일 때)
+    빈 포트를 고릅니다. max_steps_per_epoch / save_checkpoint=False 는 벤치마크용입니다.
+    """
+    def log(message):
+        report({"type": "log", "message": f"[{datetime.now().time()}] {message}"})
+
+    nproc_per_node, nnodes = max(1, int(nproc_per_node)), max(1, int(nnodes))
+    if not master_port:
+        if nnodes > 1:
+            raise ValueError("여러 호스트로 학습할 때는 master_port 를 지정해야 합니다.")
+        master_port = free_port()
+    config = {
+        "epochs": epochs, "batch_size": batch_size, "lr": lr, "fast_pipeline": fast_pipeline,
+        "num_workers": num_workers, "metrics_every": metrics_every, "max_steps_per_epoch": max_steps_per_epoch,
+        "save_checkpoint": save_checkpoint,
+        "nproc_per_node": nproc_per_node, "node_rank": node_rank, "world_size": nproc_per_node * nnodes,
+        "master_addr": master_addr, "master_port": master_port,
+        # rank 들이 코어를 나눠 쓰도록 (각자 모든 코어를 잡으면 서로 밀어내서 느려집니다)
+        "threads": max(1, (os.cpu_count() or 1) // nproc_per_node),
+    }
+    log(f"Distributed Training Started (MNIST, {DDP_BACKEND}) - node {node_rank}/{nnodes}, "
+        f"{nproc_per_node} ranks/node, world size {config['world_size']}, master {master_addr}:{master_port}")
+    log("Loading cached MNIST tensors..." if fast_pipeline else "Downloading MNIST Dataset...")
+    prepare_mnist(fast_pipeline)
+
+    ctx = mp.get_context("spawn")
+    events, stop_event = ctx.Queue(), ctx.Event()
+    procs = [ctx.Process(target=_rank_main, args=(local_rank, config, events, stop_event),
+                         name=f"ddp-rank-{node_rank * nproc_per_node + local_rank}")
+             for local_rank in range(nproc_per_node)]
+    for proc in procs:
+        proc.start()
+
+    failure = None
+    try:
+        while True:
+            if should_stop():
+                stop_event.set()
+            try:
+                event = events.get(timeout=0.2)
+            except queue.Empty:
+                dead = next((p for p in procs if p.exitcode not in (None, 0)), None)
+                if failure is None and dead is not None:
+                    failure = f"{dead.name} exited with code {dead.exitcode}"
+                if failure is not None or all(not p.is_alive() for p in procs):
+                    break
+                continue
+            if event["type"] == "rank_failed":
+                failure = f"rank {event['rank']}: {event['error']}"
+                break
+            report(event)
+    finally:
+        # 한 rank 가 실패하면 나머지는 all-reduce 에서 멈춰 있으므로 바로 정리합니다.
+        for proc in procs:
+            if failure is not None or should_stop():
+                proc.join(timeout=5 if failure is None else 0)
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+
+    if failure is not None:
+        raise RuntimeError(failure)
+    if should_stop():
+        raise TrainingCancelled()
+    log("Training Completed Successfully!")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Join a multi-host MNIST data-parallel training run")
+    parser.add_argument("--nnodes", type=int, required=True)
+    parser.add_argument("--node-rank", type=int, required=True)
+    parser.add_argument("--master-addr", required=True)
+    parser.add_argument("--master-port", type=int, required=True)
+    parser.add_argument("--nproc-per-node", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--epochs", type=int, required=True)
+    parser.add_argument("--batch-size", type=int, required=True, help="rank 하나의 배치 크기 (master 와 같아야 함)")
+    parser.add_argument("--lr", type=float, default=0.01)
+    parser.add_argument("--fast-pipeline", action="store_true")
+    parser.add_argument("--num-workers", type=int, default=0)
+    args = parser.parse_args()
+
+    def report(event):
+        if event["type"] == "log":
+            print(event["message"], flush=True)
+
+    run_distributed_training(
+        args.epochs, args.batch_size, args.lr, report, should_stop=lambda: False,
+        nproc_per_node=args.nproc_per_node, nnodes=args.nnodes, node_rank=args.node_rank,
+        master_addr=args.master_addr, master_port=args.master_port,
+        fast_pipeline=args.fast_pipeline, num_workers=args.num_workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import os
+import time
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+
+from blobs import blob_path
+from metrics import observe_transfer
+
+# ==========================================
+# 파일 다운로드 응답 (Range / ETag)
+# ==========================================
+# Starlette FileResponse 가 Range(단일/다중, 206/416) 와 If-Range 를 처리하고,
+# 서버가 http.response.pathsend 를 지원하면 전체 응답은 경로만 넘겨 서버가 직접 보냅니다.
+# 여기서는 blob 해시를 강한 ETag 로 쓰고(If-None-Match -> 304), 보낸 바이트 수만 셉니다.
+# (FileResponse 의 내부 메서드는 버전마다 바뀌므로 덮어쓰지 않고 공개 동작만 씁니다)
+
+
+def blob_etag(sha256):
+    return f'"{sha256}"'
+
+
+def etag_list_matches(header, etag):
+    # If-None-Match 는 약한 비교: W/ 접두어를 떼고 비교하며 "*" 는 항상 일치
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in [t[2:] if t.startswith("W/") else t for t in tags]
+
+
+class BlobFileResponse(FileResponse):
+    def __init__(self, *args, kind="", on_download=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.kind = kind
+        self.on_download = on_download   # 다운로드 한 번으로 셀 응답을 다 보냈을 때 호출
+
+    async def __call__(self, scope, receive, send):
+        sent = [0]
+        status = [None]
+
+        async def counting_send(message):
+            # 본문 바이트 수: 일반 전송은 body 길이, pathsend 는 파일 전체
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            elif message["type"] == "http.response.body":
+                sent[0] += len(message.get("body", b""))
+            elif message["type"] == "http.response.pathsend":
+                sent[0] += self.stat_result.st_size
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await super().__call__(scope, receive, counting_send)
+        finally:
+            observe_transfer("download", self.kind, sent[0], time.perf_counter() - started)
+        # 206/416 과 If-Range 불일치 시의 전체 응답(200) 은 __call__ 안에서 정해지므로, 실제로 보낸 상태로 셉니다.
+        if self.on_download and counts_as_download(scope, status[0]):
+            self.on_download()
+
+
+def blob_response(request, entry, on_download=None):
+    """매니페스트 항목(RepoFile) 을 다운로드 응답으로 만듭니다. blob 파일이 없으면 None.
+
+    on_download() 는 다운로드 한 번으로 칠 응답을 끝까지 보낸 뒤 호출됩니다.
+    """
+    etag = blob_etag(entry.sha256)
+    if etag_list_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    path = blob_path(entry.sha256)
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return BlobFileResponse(path, filename=entry.filename, stat_result=stat_result, headers={"etag": etag},
+                            kind=entry.kind, on_download=on_download)
+
+
+def counts_as_download(scope, status):
+    # 전체 응답(200) 과 처음부터 받는 범위 요청(206, bytes=0-) 만 셉니다.
+    # 이어받기/분할 다운로드의 뒷부분 요청, 416 과 HEAD 는 다운로드 수에 넣지 않습니다.
+    if scope.get("method") != "GET":
+        return False
+    if status == 200:
+        return True
+    http_range = Headers(scope=scope).get("range", "").replace(" ", "")
+    return status == 206 and http_range.startswith("bytes=0-")
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import INFERENCE_BATCH_SIZE, INFERENCE_SECONDS
+
+
+# ==========================================
+# 동시 요청을 묶어서 한 번에 추론하는 마이크로 배처
+# ==========================================
+class MicroBatcher:
+    """동시에 들어온 추론 요청을 모아 infer_fn(texts) 한 번으로 처리합니다.
+
+    infer_fn 은 텍스트 리스트를 받아 같은 순서의 결과 리스트를 돌려줘야 합니다.
+    모델 호출은 전용 스레드 하나에서만 돌기 때문에 이벤트 루프를 막지 않고,
+    모델이 바쁜 동안 쌓인 요청은 다음 배치에 자연스럽게 합쳐집니다.
+    """
+
+    def __init__(self, infer_fn, max_batch_size=32, max_wait_ms=5.0, name="default"):
+        self.infer_fn = infer_fn
+        self.name = name
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue = None
+        self._worker = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="micro-batcher")
+        self._last_batch_size = 0
+
+    async def submit(self, text):
+        return (await self.submit_many([text]))[0]
+
+    async def submit_many(self, texts):
+        self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            fut = loop.create_future()
+            self._queue.put_nowait((text, fut))
+            futures.append(fut)
+        return await asyncio.gather(*futures)
+
+    def _ensure_worker(self):
+        # 이벤트 루프가 떠 있는 시점에 처음 호출될 때 큐와 워커를 만듭니다.
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _collect(self):
+        batch = [await self._queue.get()]
+        self._drain(batch)
+
+        # 부하가 없을 때(직전 배치가 1건이고 큐도 비어 있음)는 기다리지 않고 바로 보냅니다.
+        busy = self._last_batch_size > 1 or len(batch) > 1
+        if busy and self.max_wait > 0 and len(batch) < self.max_batch_size:
+            deadline = asyncio.get_running_loop().time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                self._drain(batch)
+        return batch
+
+    def _drain(self, batch):
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # 기다리다 끊긴 요청(클라이언트 연결 종료 등)은 빼고 추론합니다.
+            batch = [(text, fut) for text, fut in batch if not fut.done()]
+            self._last_batch_size = len(batch)
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            INFERENCE_BATCH_SIZE.labels(self.name).observe(len(texts))
+            started = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(self._executor, self.infer_fn, texts)
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            finally:
+                INFERENCE_SECONDS.labels(self.name).observe(time.perf_counter() - started)
+
+            for (_, fut), result in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(result)
@@ -0,0 +1,275 @@
+import importlib
+import multiprocessing as mp
+import queue
+import threading
+import traceback
+import uuid
+from collections import deque
+from datetime import datetime
+
+from metrics import TRAINING_EPOCH_SECONDS, TRAINING_SAMPLES_PER_SECOND
+
+
+# ==========================================
+# 작업자 프로세스 기반 작업 큐 (학습 등 무거운 작업용)
+# ==========================================
+# 작업은 "모듈:함수" 문자열로 지정하고, 별도 프로세스에서 함수(**params, report, should_stop)
+# 형태로 실행됩니다. API 서버의 이벤트 루프/스레드풀과는 완전히 분리됩니다.
+CANCEL_GRACE_SECONDS = 10
+# 작업별 로그/이벤트는 고정 크기 링 버퍼에 보관하고, 모든 항목에 증가하는 seq 를 붙입니다.
+# 클라이언트는 마지막으로 받은 seq 를 since 로 넘겨 새 항목만 가져갈 수 있습니다.
+JOB_LOG_LIMIT = 500
+JOB_EVENT_LIMIT = 2000
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+def _job_entry(target, job_id, params, events, cancel_event):
+    module_name, func_name = target.split(":")
+    try:
+        func = getattr(importlib.import_module(module_name), func_name)
+        func(
+            **params,
+            report=lambda event: events.put((job_id, event)),
+            should_stop=cancel_event.is_set,
+        )
+    except Exception as e:
+        if cancel_event.is_set():
+            events.put((job_id, {"type": "cancelled"}))
+        else:
+            print(traceback.format_exc())
+            events.put((job_id, {"type": "failed", "error": str(e)}))
+        return
+    if cancel_event.is_set():
+        events.put((job_id, {"type": "cancelled"}))
+    else:
+        events.put((job_id, {"type": "completed"}))
+
+
+class JobManager:
+    def __init__(self, max_workers=1, max_queue=8, max_finished=50):
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self.max_finished = max(1, int(max_finished))
+        self._ctx = mp.get_context("spawn")
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._jobs = {}
+        self._pending = deque()
+        self._running = {}   # job_id -> (process, cancel_event, cancel_requested_at)
+        self._finished = deque()
+        self._events = None
+        self._threads = []
+        self._stopping = False
+
+    # --- 수명 주기 ---
+    def start(self):
+        if self._threads:
+            return
+        self._events = self._ctx.Queue()
+        self._stopping = False
+        self._threads = [
+            threading.Thread(target=self._dispatch_loop, name="job-dispatcher", daemon=True),
+            threading.Thread(target=self._event_loop, name="job-events", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+
+    def shutdown(self, timeout=5):
+        with self._lock:
+            self._stopping = True
+            running = list(self._running.items())
+            self._wakeup.notify_all()
+        for _, (proc, cancel_event, _) in running:
+            cancel_event.set()
+        for _, (proc, _, _) in running:
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+        self._threads = []
+
+    # --- 공개 API ---
+    def submit(self, kind, target, params, total_epochs=None):
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "job_id": job_id,
+            "kind": kind,
+            "status": "queued",
+            "params": params,
+            "progress": 0,
+            "epoch": 0,
+            "total_epochs": total_epochs,
+            "logs": deque(maxlen=JOB_LOG_LIMIT),      # (seq, message)
+            "events": deque(maxlen=JOB_EVENT_LIMIT),  # {"seq", "type", ...}
+            "seq": 0,
+            "metrics": None,
+            "error": None,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "started_at": None,
+            "finished_at": None,
+        }
+        with self._lock:
+            free_slots = max(0, self.max_workers - len(self._running))
+            if len(self._pending) >= self.max_queue + free_slots:
+                raise JobQueueFull()
+            self._jobs[job_id] = job
+            self._pending.append((job_id, target))
+            self._wakeup.notify_all()
+            return _summary(job)
+
+    def get(self, job_id, since=None):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return _snapshot(job, since) if job else None
+
+    def latest(self, since=None):
+        with self._lock:
+            if not self._jobs:
+                return None
+            return _snapshot(next(reversed(self._jobs.values())), since)
+
+    def list(self):
+        with self._lock:
+            return [_summary(job) for job in reversed(self._jobs.values())]
+
+    def events(self, job_id, since=0):
+        """since 이후의 이벤트와 새 커서, 작업 종료 여부를 돌려줍니다. 작업이 없으면 None."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            events = [e for e in job["events"] if e["seq"] > since]
+            return events, job["seq"], job["status"] not in ("queued", "running")
+
+    def cancel(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job["status"] not in ("queued", "running"):
+                return False
+            if job["status"] == "queued":
+                self._pending = deque(p for p in self._pending if p[0] != job_id)
+                self._finish(job, "cancelled")
+                return True
+            proc, cancel_event, _ = self._running[job_id]
+            cancel_event.set()
+            self._running[job_id] = (proc, cancel_event, datetime.now())
+            self._wakeup.notify_all()
+            return True
+
+    # --- 내부 동작 ---
+    def _finish(self, job, status, error=None):
+        # self._lock 을 잡은 상태에서만 호출합니다.
+        job["status"] = status
+        job["error"] = error
+        job["finished_at"] = datetime.now().isoformat(timespec="seconds")
+        _push_event(job, {"type": "status", "status": status, "error": error})
+        TRAINING_SAMPLES_PER_SECOND.labels(job["kind"]).set(0)
+        self._running.pop(job["job_id"], None)
+        self._finished.append(job["job_id"])
+        while len(self._finished) > self.max_finished:
+            self._jobs.pop(self._finished.popleft(), None)
+        self._wakeup.notify_all()
+
+    def _dispatch_loop(self):
+        with self._lock:
+            while not self._stopping:
+                self._reap()
+                while self._pending and len(self._running) < self.max_workers:
+                    job_id, target = self._pending.popleft()
+                    job = self._jobs[job_id]
+                    cancel_event = self._ctx.Event()
+                    proc = self._ctx.Process(
+                        target=_job_entry,
+                        args=(target, job_id, job["params"], self._events, cancel_event),
+                        name=f"job-{job_id}",
+                    )
+                    proc.start()
+                    self._running[job_id] = (proc, cancel_event, None)
+                    job["status"] = "running"
+                    job["started_at"] = datetime.now().isoformat(timespec="seconds")
+                    _push_event(job, {"type": "status", "status": "running", "error": None})
+                self._wakeup.wait(timeout=0.5)
+
+    def _reap(self):
+        # 결과 이벤트 없이 죽은 프로세스 정리 + 취소 요청 후 오래 버티는 프로세스 강제 종료
+        now = datetime.now()
+        for job_id, (proc, _, cancel_requested_at) in list(self._running.items()):
+            if cancel_requested_at and proc.is_alive() and (now - cancel_requested_at).total_seconds() > CANCEL_GRACE_SECONDS:
+                proc.terminate()
+            if not proc.is_alive() and proc.exitcode is not None:
+                proc.join()
+                job = self._jobs.get(job_id)
+                # 정상 종료라면 마지막 이벤트가 곧 도착하므로 잠시 기다립니다.
+                if job and job["status"] == "running" and (proc.exitcode != 0 or cancel_requested_at):
+                    if cancel_requested_at:
+                        self._finish(job, "cancelled")
+                    else:
+                        self._finish(job, "failed", f"worker exited with code {proc.exitcode}")
+
+    def _event_loop(self):
+        while not self._stopping:
+            try:
+                job_id, event = self._events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job["status"] not in ("queued", "running"):
+                    continue
+                self._apply(job, event)
+
+    def _apply(self, job, event):
+        kind = event.get("type")
+        if kind == "log":
+            _push_log(job, event["message"])
+        elif kind == "progress":
+            job.update({k: v for k, v in event.items() if k != "type"})
+            _push_event(job, event)
+            _record_training_metrics(job, event)
+        elif kind == "metrics":
+            job["metrics"] = {k: v for k, v in event.items() if k != "type"}
+            _push_event(job, event)
+            _record_training_metrics(job, event)
+        elif kind == "completed":
+            job["progress"] = 100
+            self._finish(job, "completed")
+        elif kind == "cancelled":
+            _push_log(job, f"[{datetime.now().time()}] Training Cancelled.")
+            self._finish(job, "cancelled")
+        elif kind == "failed":
+            _push_log(job, f"[ERROR] {event.get('error')}")
+            self._finish(job, "failed", event.get("error"))
+
+
+def _record_training_metrics(job, event):
+    if "samples_per_sec" in event:
+        TRAINING_SAMPLES_PER_SECOND.labels(job["kind"]).set(event["samples_per_sec"])
+    if "epoch_seconds" in event:
+        TRAINING_EPOCH_SECONDS.labels(job["kind"]).observe(event["epoch_seconds"])
+
+
+def _push_event(job, event):
+    job["seq"] += 1
+    job["events"].append({**event, "seq": job["seq"]})
+    return job["seq"]
+
+
+def _push_log(job, message):
+    seq = _push_event(job, {"type": "log", "message": message})
+    job["logs"].append((seq, message))
+
+
+def _summary(job):
+    return {k: v for k, v in job.items() if k not in ("logs", "events")}
+
+
+def _snapshot(job, since=None):
+    # since 가 주어지면 그 이후의 로그만 담습니다. cursor 는 다음 요청에 since 로 넘기면 됩니다.
+    snap = _summary(job)
+    snap["logs"] = [msg for seq, msg in job["logs"] if since is None or seq > since]
+    snap["cursor"] = job["seq"]
+    return snap
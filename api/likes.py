@@ -0,0 +1,54 @@
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from database import Like
+from listing import bump_listing_version
+
+# ==========================================
+# 좋아요 (likes 테이블 + 대상 테이블의 likes 카운터)
+# ==========================================
+# (username, target_type, target_id) 유니크 제약 덕분에 동시에 눌러도 중복 행이 생기지 않고,
+# 카운터는 "likes = likes ± 1" 로 DB 안에서 원자적으로 바뀝니다.
+
+
+def has_liked(db, kind, target_id, username):
+    if not username:
+        return False
+    return db.query(Like.id).filter(
+        Like.username == username, Like.target_type == kind, Like.target_id == target_id
+    ).first() is not None
+
+
+def _adjust(db, table, target_id, delta):
+    db.execute(update(table).where(table.id == target_id).values(likes=table.likes + delta))
+
+
+def toggle_like(db, kind, table, target_id, username):
+    """좋아요를 토글하고 (liked, likes) 를 돌려줍니다. commit 까지 합니다."""
+    removed = db.query(Like).filter(
+        Like.username == username, Like.target_type == kind, Like.target_id == target_id
+    ).delete(synchronize_session=False)
+    if removed:
+        _adjust(db, table, target_id, -removed)
+        liked = False
+    else:
+        db.add(Like(username=username, target_type=kind, target_id=target_id))
+        try:
+            db.flush()
+        except IntegrityError:
+            # 같은 사용자의 동시 요청이 먼저 넣었으면 이미 좋아요 상태입니다.
+            db.rollback()
+            return True, _current_likes(db, table, target_id)
+        _adjust(db, table, target_id, 1)
+        liked = True
+    bump_listing_version(db, kind)
+    db.commit()
+    return liked, _current_likes(db, table, target_id)
+
+
+def delete_likes(db, kind, target_id):
+    db.query(Like).filter(Like.target_type == kind, Like.target_id == target_id).delete(synchronize_session=False)
+
+
+def _current_likes(db, table, target_id):
+    return db.query(table.likes).filter(table.id == target_id).scalar() or 0
@@ -0,0 +1,112 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+
+from sqlalchemy import func, tuple_
+from sqlalchemy.exc import IntegrityError
+
+from database import ListingVersion
+
+# ==========================================
+# 목록 API 공통: keyset 페이지네이션 / 필터 / 정렬 / ETag
+# ==========================================
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def sort_columns(table, sort):
+    """정렬 키 목록. 마지막은 항상 (created_at, id) 라서 커서가 유일하게 정해집니다."""
+    if sort == "recent":
+        return [table.created_at, table.id]
+    if sort == "likes":
+        return [func.coalesce(table.likes, 0), table.created_at, table.id]
+    if sort == "downloads":
+        return [func.coalesce(table.downloads, 0), table.created_at, table.id]
+    raise ValueError(sort)
+
+
+def _cursor_values(row, sort):
+    created_at = row.created_at.isoformat()
+    if sort == "recent":
+        return [created_at, row.id]
+    if sort == "likes":
+        return [row.likes or 0, created_at, row.id]
+    return [row.downloads or 0, created_at, row.id]
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, sort):
+    values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    if not isinstance(values, list) or len(values) != (2 if sort == "recent" else 3):
+        raise ValueError(cursor)
+    # created_at 은 항상 끝에서 두 번째 값
+    values[-2] = datetime.fromisoformat(values[-2])
+    return values
+
+
+def normalize_tag(tag):
+    # 저장된 tags 와 같은 방식으로 공백을 모두 빼고 비교합니다. ("text generation" == "textgeneration")
+    return (tag or "").replace(" ", "")
+
+
+def apply_filters(query, table, author=None, license=None, tag=None):
+    if author:
+        query = query.filter(table.author == author)
+    if license:
+        query = query.filter(table.license == license)
+    if tag:
+        # tags 는 "nlp, bert" 같은 쉼표 문자열이라 양끝에 쉼표를 붙여 정확히 한 태그만 매칭합니다.
+        normalized = "," + func.replace(func.coalesce(table.tags, ""), " ", "") + ","
+        query = query.filter(normalized.contains(f",{normalize_tag(tag)},", autoescape=True))
+    return query
+
+
+def paginate(query, table, sort="recent", cursor=None, limit=DEFAULT_PAGE_SIZE):
+    """(rows, next_cursor) 를 돌려줍니다. limit=None 이면 전부. 잘못된 sort/cursor 는 ValueError."""
+    columns = sort_columns(table, sort)
+    if cursor:
+        query = query.filter(tuple_(*columns) < tuple_(*decode_cursor(cursor, sort)))
+    query = query.order_by(*[c.desc() for c in columns])
+    if limit is None:
+        return query.all(), None
+    rows = query.limit(limit + 1).all()
+    next_cursor = encode_cursor(_cursor_values(rows[limit - 1], sort)) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+# ------------------------------------------
+# ETag: 목록에 영향을 주는 쓰기마다 종류별 버전 번호를 올리고,
+# 버전 + 요청 파라미터로 ETag 를 만들어 바뀐 게 없으면 행을 읽지 않고 304 를 돌려줍니다.
+# ------------------------------------------
+def bump_listing_version(db, kind):
+    """같은 트랜잭션 안에서 버전을 올립니다. (commit 은 호출한 쪽에서)"""
+    updated = db.query(ListingVersion).filter(ListingVersion.kind == kind).update(
+        {ListingVersion.version: ListingVersion.version + 1}, synchronize_session=False)
+    if updated:
+        return
+    try:
+        with db.begin_nested():
+            db.add(ListingVersion(kind=kind, version=1))
+    except IntegrityError:
+        # 동시에 첫 쓰기가 일어나서 다른 요청이 먼저 행을 만들었으면 증가만 합니다.
+        bump_listing_version(db, kind)
+
+
+def get_listing_version(db, kind):
+    row = db.get(ListingVersion, kind)
+    return row.version if row else 0
+
+
+def make_etag(kind, version, params):
+    digest = hashlib.sha1(json.dumps([kind, version, params], sort_keys=True, default=str).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]
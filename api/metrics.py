@@ -0,0 +1,269 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+# ==========================================
+# Prometheus 지표 (텍스트 노출 형식, 외부 의존성 없음)
+# ==========================================
+# 지표는 모듈 전역으로 한 번만 만들고, 각 모듈이 import 해서 값을 올립니다.
+# GET /metrics 는 render() 결과를 text/plain; version=0.0.4 로 돌려줍니다.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 지연시간(초) 기본 버킷
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_registry = []
+_registry_lock = threading.Lock()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)] + [f'{n}="{v}"' for n, v in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children = {}
+        with _registry_lock:
+            _registry.append(self)
+
+    def labels(self, *values):
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        # 레이블이 없는 지표는 metric.inc() 처럼 바로 씁니다.
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def samples(self):
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            yield from child.samples(self.name, self.labelnames, values)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines += [f"{name}{labels} {_format_value(value)}" for name, labels, value in self.samples()]
+        return "\n".join(lines)
+
+
+class _Value:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value):
+        with self._lock:
+            self.value = float(value)
+
+    def samples(self, name, labelnames, values):
+        yield name, _format_labels(labelnames, values), self.value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+    def samples(self):
+        for name, labels, value in super().samples():
+            yield name + "_total", labels, value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+    def dec(self, amount=1):
+        self._default().dec(amount)
+
+    def set(self, value):
+        self._default().set(value)
+
+
+class CallbackGauge(_Metric):
+    """조회할 때마다 fn() 이 돌려주는 {레이블 값 튜플: 값} 으로 채워지는 게이지."""
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames, fn):
+        super().__init__(name, documentation, labelnames)
+        self.fn = fn
+
+    def samples(self):
+        try:
+            values = self.fn()
+        except Exception:
+            return
+        for key, value in values.items():
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+class _HistogramValue:
+    def __init__(self, buckets):
+        self._lock = threading.Lock()
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+
+    @contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def samples(self, name, labelnames, values):
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative = 0
+        for bound, n in zip(self.buckets, counts):
+            cumulative += n
+            yield name + "_bucket", _format_labels(labelnames, values, [("le", _format_value(float(bound)))]), cumulative
+        yield name + "_sum", _format_labels(labelnames, values), total
+        yield name + "_count", _format_labels(labelnames, values), count
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets)) + (math.inf,)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value):
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+
+def render():
+    with _registry_lock:
+        metrics = list(_registry)
+    return "\n".join(m.render() for m in metrics) + "\n"
+
+
+# ------------------------------------------
+# 지표 정의
+# ------------------------------------------
+_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+_BYTES_PER_SECOND_BUCKETS = tuple(2 ** p * 1024 * 1024 for p in range(-4, 12))   # 64KB/s ~ 2GB/s
+
+HTTP_REQUEST_SECONDS = Histogram("http_request_duration_seconds", "HTTP request latency by route",
+                                 ["method", "route", "status"])
+HTTP_REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being served")
+
+INFERENCE_SECONDS = Histogram("inference_batch_duration_seconds", "Model call time per micro-batch", ["model"])
+INFERENCE_BATCH_SIZE = Histogram("inference_batch_size", "Requests merged into one micro-batch", ["model"],
+                                 buckets=_SIZE_BUCKETS)
+
+TRAINING_SAMPLES_PER_SECOND = Gauge("training_samples_per_second", "Latest training throughput reported by a job",
+                                    ["kind"])
+TRAINING_EPOCH_SECONDS = Histogram("training_epoch_duration_seconds", "Wall time per training epoch", ["kind"],
+                                   buckets=(1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600))
+
+DB_POOL_CHECKOUT_SECONDS = Histogram("db_pool_checkout_wait_seconds",
+                                     "Time spent waiting for a pooled DB connection", ["pool"])
+
+TRANSFER_BYTES = Counter("transfer_bytes", "Bytes uploaded / downloaded", ["direction", "kind"])
+TRANSFER_THROUGHPUT = Histogram("transfer_throughput_bytes_per_second",
+                                "Per-request upload / download throughput", ["direction"],
+                                buckets=_BYTES_PER_SECOND_BUCKETS)
+
+STORAGE_SCAN_SECONDS = Histogram("storage_scan_duration_seconds", "Time to scan one repository folder")
+
+
+def observe_transfer(direction, kind, nbytes, seconds):
+    TRANSFER_BYTES.labels(direction, kind).inc(nbytes)
+    if nbytes and seconds > 0:
+        TRANSFER_THROUGHPUT.labels(direction).observe(nbytes / seconds)
+
+
+# ------------------------------------------
+# 요청 지연시간 / 동시 요청 수 미들웨어 (순수 ASGI)
+# ------------------------------------------
+class MetricsMiddleware:
+    """route 레이블은 경로 템플릿("/models/{model_name}") 이라 이름별로 시계열이 늘지 않습니다.
+    SSE 같은 스트리밍 응답은 스트림이 끝날 때까지를 잽니다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"], getattr(route, "path", "unmatched"), status["code"]
+            ).observe(time.perf_counter() - started)
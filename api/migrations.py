@@ -0,0 +1,138 @@
+"""DB 스키마 마이그레이션
+
+서버 시작 시(lifespan) 자동으로 실행되고, 직접 돌릴 수도 있습니다:
+    python migrations.py
+
+각 단계는 schema_migrations 테이블에 기록되어 한 번만 적용되며,
+현재 스키마를 확인하고 필요한 경우에만 변경하도록 작성합니다.
+"""
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+
+from database import Base
+
+
+def _column_type(conn, table, column):
+    for col in inspect(conn).get_columns(table):
+        if col["name"] == column:
+            return col["type"]
+    return None
+
+
+def _rebuild_sqlite_table(conn, table, select_exprs):
+    """SQLite 는 컬럼 타입을 바꿀 수 없으므로 현재 모델 정의로 테이블을 새로 만들고 데이터를 옮깁니다.
+
+    select_exprs 는 {컬럼명: 옛 테이블에서 값을 꺼낼 SQL 식} 으로, 없는 컬럼은 그대로 복사합니다.
+    모델에 없는 옛 컬럼(뒤 단계에서 옮길 liked_by 등)도 지우지 않고 그대로 남깁니다.
+    """
+    old_columns = inspect(conn).get_columns(table)
+    old_names = [c["name"] for c in old_columns]
+    for index in inspect(conn).get_indexes(table):
+        conn.execute(text(f'DROP INDEX IF EXISTS "{index["name"]}"'))
+    conn.execute(text(f"ALTER TABLE {table} RENAME TO {table}__old"))
+    model_table = Base.metadata.tables[table]
+    model_table.create(conn)
+    for col in old_columns:
+        if col["name"] not in model_table.columns:
+            conn.execute(text(f'ALTER TABLE {table} ADD COLUMN "{col["name"]}" {col["type"].compile(conn.dialect)}'))
+    new_columns = [c["name"] for c in inspect(conn).get_columns(table) if c["name"] in old_names]
+    exprs = [select_exprs.get(c, c) for c in new_columns]
+    conn.execute(text(f"INSERT INTO {table} ({', '.join(new_columns)}) SELECT {', '.join(exprs)} FROM {table}__old"))
+    conn.execute(text(f"DROP TABLE {table}__old"))
+
+
+def downloads_to_integer(conn):
+    # "123" 같은 문자열로 저장하던 downloads 를 정수 컬럼으로 바꿉니다. (숫자가 아닌 값은 0)
+    for table in ("ai_models", "datasets"):
+        col_type = _column_type(conn, table, "downloads")
+        if col_type is None or col_type.python_type is int:
+            continue
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN downloads DROP DEFAULT"))
+            conn.execute(text(
+                f"ALTER TABLE {table} ALTER COLUMN downloads TYPE INTEGER "
+                f"USING (CASE WHEN downloads ~ '^[0-9]+$' THEN downloads::integer ELSE 0 END)"
+            ))
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN downloads SET DEFAULT 0"))
+        else:
+            _rebuild_sqlite_table(conn, table, {
+                "downloads": "CASE WHEN downloads GLOB '[0-9]*' AND downloads NOT GLOB '*[^0-9]*' "
+                             "THEN CAST(downloads AS INTEGER) ELSE 0 END",
+            })
+
+
+def liked_by_to_likes(conn):
+    # 쉼표로 이어 붙인 liked_by 문자열을 likes 테이블 행으로 옮기고, likes 수를 다시 계산한 뒤 컬럼을 지웁니다.
+    for table, target_type in (("ai_models", "models"), ("datasets", "datasets")):
+        if _column_type(conn, table, "liked_by") is None:
+            continue
+        rows = conn.execute(text(f"SELECT id, liked_by FROM {table} WHERE liked_by IS NOT NULL AND liked_by <> ''")).all()
+        for target_id, liked_by in rows:
+            users = dict.fromkeys(u.strip() for u in liked_by.split(",") if u.strip())
+            for username in users:
+                exists = conn.execute(
+                    text("SELECT 1 FROM likes WHERE username = :u AND target_type = :t AND target_id = :i"),
+                    {"u": username, "t": target_type, "i": target_id},
+                ).first()
+                if not exists:
+                    conn.execute(
+                        text("INSERT INTO likes (username, target_type, target_id, created_at) VALUES (:u, :t, :i, :at)"),
+                        {"u": username, "t": target_type, "i": target_id, "at": datetime.utcnow()},
+                    )
+        conn.execute(text(
+            f"UPDATE {table} SET likes = (SELECT COUNT(*) FROM likes "
+            f"WHERE likes.target_type = '{target_type}' AND likes.target_id = {table}.id)"
+        ))
+        conn.execute(text(f"ALTER TABLE {table} DROP COLUMN liked_by"))
+
+
+def comment_thread_index(conn):
+    # 대상별 최신순 페이지용 복합 인덱스를 만들고, 그 앞부분과 겹치는 단일 컬럼 인덱스는 지웁니다.
+    # 그리고 comment_counts 를 지금까지의 댓글로 다시 채웁니다.
+    comments = Base.metadata.tables["comments"]
+    for index in comments.indexes:
+        if index.name == "ix_comments_thread":
+            index.create(conn, checkfirst=True)
+    for name in ("ix_comments_target_type", "ix_comments_target_id"):
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    conn.execute(text("DELETE FROM comment_counts"))
+    conn.execute(text(
+        "INSERT INTO comment_counts (target_type, target_id, count) "
+        "SELECT target_type, target_id, COUNT(*) FROM comments "
+        "WHERE target_type IS NOT NULL AND target_id IS NOT NULL GROUP BY target_type, target_id"
+    ))
+
+
+# (id, 함수) - 순서대로 적용됩니다. 이미 배포된 단계의 id 는 바꾸지 마세요.
+MIGRATIONS = [
+    ("0001_downloads_integer", downloads_to_integer),
+    ("0002_liked_by_to_likes", liked_by_to_likes),
+    ("0003_comment_thread_index", comment_thread_index),
+]
+
+
+def run_migrations(engine):
+    applied = []
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS schema_migrations (id VARCHAR PRIMARY KEY, applied_at VARCHAR)"))
+        done = {row[0] for row in conn.execute(text("SELECT id FROM schema_migrations"))}
+    for migration_id, step in MIGRATIONS:
+        if migration_id in done:
+            continue
+        with engine.begin() as conn:
+            step(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (id, applied_at) VALUES (:id, :at)"),
+                {"id": migration_id, "at": datetime.utcnow().isoformat(timespec="seconds")},
+            )
+        print(f"✅ migration applied: {migration_id}")
+        applied.append(migration_id)
+    return applied
+
+
+if __name__ == "__main__":
+    from database import Base, engine
+    Base.metadata.create_all(bind=engine)
+    applied = run_migrations(engine)
+    print(f"{len(applied)}개의 마이그레이션을 적용했습니다." if applied else "적용할 마이그레이션이 없습니다.")
@@ -0,0 +1,131 @@
+import base64
+import os
+import re
+import threading
+
+from cache import LRUCache
+
+# ==========================================
+# MNIST 체크포인트 서빙 (메모리 상한이 있는 LRU 모델 캐시)
+# ==========================================
+# 체크포인트는 (경로, mtime, 크기) 를 키로 캐시하므로, 학습이 끝나서 파일이 바뀌면 다음 요청이
+# 새 파일을 읽고(hot reload) 예전 모델은 LRU 로 밀려납니다. 버전별 체크포인트를 여러 개 올려 두고
+# 같이 서빙할 수 있고, 캐시 용량은 파라미터 텐서 바이트 합으로 셉니다.
+# 경로는 training.py 의 MNIST_CHECKPOINT / MNIST_VERSION_DIR 과 같습니다.
+# (torch / training 모듈은 첫 추론 때 불러옵니다)
+MNIST_CHECKPOINT = os.path.join("./models", "mnist_model.pt")
+MNIST_VERSION_DIR = os.path.join("./models", "mnist")
+MNIST_PIXELS = 28 * 28
+_VERSION_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+class CheckpointNotFound(Exception):
+    pass
+
+
+def decode_images(images=None, images_b64=None):
+    """요청 본문의 이미지를 (N, 28, 28) uint8 텐서로 만듭니다. 모양이 틀리면 ValueError.
+
+    images: 28x28 픽셀값(0~255) 중첩 리스트들, images_b64: 784 바이트(행 우선 uint8) 의 base64 문자열들
+    """
+    import torch
+    tensors = []
+    if images:
+        batch = torch.tensor(images, dtype=torch.float32)
+        if batch.dim() != 3 or tuple(batch.shape[1:]) != (28, 28):
+            raise ValueError("images 는 28x28 배열의 목록이어야 합니다.")
+        tensors.append(batch.clamp_(0, 255).to(torch.uint8))
+    if images_b64:
+        raw = b"".join(base64.b64decode(item, validate=True) for item in images_b64)
+        if len(raw) != MNIST_PIXELS * len(images_b64):
+            raise ValueError(f"images_b64 의 각 항목은 {MNIST_PIXELS} 바이트여야 합니다.")
+        tensors.append(torch.frombuffer(bytearray(raw), dtype=torch.uint8).view(-1, 28, 28))
+    if not tensors:
+        raise ValueError("images 또는 images_b64 가 필요합니다.")
+    return torch.cat(tensors) if len(tensors) > 1 else tensors[0]
+
+
+class MnistModelServer:
+    def __init__(self, checkpoint=MNIST_CHECKPOINT, version_dir=MNIST_VERSION_DIR,
+                 max_bytes=256 * 1024 * 1024, max_entries=8):
+        self.checkpoint = checkpoint
+        self.version_dir = version_dir
+        self._cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+        self._load_lock = threading.Lock()
+        self.loads = 0
+        self.oversized_loads = 0       # 캐시 용량보다 커서 올리지 못하고 매번 다시 읽은 횟수
+        self._oversized_warned = set()
+        self._device = None
+
+    # --- 체크포인트 찾기 ---
+    def _path(self, version):
+        if version in (None, "", "latest"):
+            return self.checkpoint
+        if not _VERSION_RE.match(version):
+            raise CheckpointNotFound(version)
+        return os.path.join(self.version_dir, f"{version}.pt")
+
+    def versions(self):
+        try:
+            names = sorted((e.name[:-3] for e in os.scandir(self.version_dir)
+                            if e.is_file() and e.name.endswith(".pt")), reverse=True)
+        except FileNotFoundError:
+            names = []
+        return (["latest"] if os.path.exists(self.checkpoint) else []) + names
+
+    # --- 모델 로딩 ---
+    def _load(self, path):
+        import torch
+        from training import build_mnist_model, get_device
+        if self._device is None:
+            self._device = get_device()
+        state_dict = torch.load(path, map_location=self._device, weights_only=True)
+        model = build_mnist_model().to(self._device)
+        model.load_state_dict(state_dict)
+        model.eval()
+        nbytes = sum(t.numel() * t.element_size() for t in model.state_dict().values())
+        return model, nbytes
+
+    def get_model(self, version="latest"):
+        """(모델, 체크포인트 정보). 파일이 없으면 CheckpointNotFound."""
+        path = self._path(version)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise CheckpointNotFound(version)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        entry = self._cache.get(key)
+        if entry is None:
+            # 같은 체크포인트를 여러 요청이 동시에 읽지 않도록 처음 한 요청만 로딩합니다.
+            with self._load_lock:
+                entry = self._cache.get(key)
+                if entry is None:
+                    model, nbytes = self._load(path)
+                    entry = (model, {"version": version or "latest", "mtime": st.st_mtime, "bytes": nbytes})
+                    self._cache.put(key, entry, size=nbytes)
+                    self.loads += 1
+                    if nbytes > self._cache.max_bytes:
+                        # LRUCache 는 용량보다 큰 값을 조용히 버리므로, 매 요청 디스크에서 다시 읽게 됩니다.
+                        self.oversized_loads += 1
+                        if key not in self._oversized_warned:
+                            self._oversized_warned.add(key)
+                            print(f"⚠️ MNIST 체크포인트({path}, {nbytes} bytes) 가 캐시 용량"
+                                  f"({self._cache.max_bytes} bytes) 보다 커서 캐시하지 않습니다. MNIST_CACHE_MB 를 늘려주세요.")
+        return entry
+
+    # --- 추론 ---
+    def predict(self, images, version="latest"):
+        """images: (N, 28, 28) uint8 텐서. ([{"label", "score"}...], 체크포인트 정보)"""
+        import torch
+        from training import MNIST_MEAN, MNIST_STD
+        model, info = self.get_model(version)
+        with torch.inference_mode():
+            batch = images.to(self._device, dtype=torch.float32).div_(255.0).sub_(MNIST_MEAN).div_(MNIST_STD)
+            probs = torch.softmax(model(batch.unsqueeze(1)), dim=1)
+            scores, labels = probs.max(dim=1)
+        results = [{"label": int(label), "score": round(float(score), 4)}
+                   for label, score in zip(labels.tolist(), scores.tolist())]
+        return results, info
+
+    def stats(self):
+        return {"loads": self.loads, "oversized_loads": self.oversized_loads, "cache": self._cache.stats()}
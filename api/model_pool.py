@@ -0,0 +1,227 @@
+import asyncio
+import ctypes
+import gc
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+from starlette.concurrency import run_in_threadpool
+
+from storage import repo_dir
+
+# ==========================================
+# 허브 모델 추론 풀 (처음 쓸 때 로딩 + RSS 예산 LRU + 유휴 해제)
+# ==========================================
+# 업로드된 모델은 요청이 처음 들어올 때 storage/models/{name}/ 에서 불러오고, 프로세스 RSS 가 예산을
+# 넘지 않도록 사용 중이 아닌 모델을 오래 안 쓴 순서로 내립니다. 오래 안 쓴 모델은 sweep 이 내리고,
+# 모델마다 동시에 추론하는 요청 수를 제한합니다. 폴더가 바뀌면(새 파일 업로드) 다음 요청에서 다시 읽습니다.
+WEIGHT_SUFFIXES = (".safetensors", ".bin", ".pt", ".pth")
+
+
+class ModelNotServable(Exception):
+    """폴더에 config.json 이 없거나 불러오다 실패한 모델."""
+
+
+class PoolExhausted(Exception):
+    """다른 모델이 모두 사용 중이라 메모리 예산 안에 새 모델을 올릴 수 없음."""
+
+
+class ModelBusy(Exception):
+    """모델별 대기열이 가득 참."""
+
+
+def current_rss():
+    # 리눅스는 /proc 에서 현재 RSS 를 읽고, 그 밖의 환경에서는 None (추정치만 씁니다)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _release_memory():
+    gc.collect()
+    try:
+        # glibc 가 해제된 힙을 OS 에 돌려주도록 (없으면 무시)
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+def estimate_model_bytes(model_dir):
+    """가중치 파일 크기 합 (로딩 전 예산 계산용)."""
+    total = 0
+    for entry in os.scandir(model_dir):
+        if entry.is_file() and entry.name.endswith(WEIGHT_SUFFIXES):
+            total += entry.stat().st_size
+    return total
+
+
+class _Entry:
+    def __init__(self, name, signature, run, nbytes, max_concurrency):
+        self.name = name
+        self.signature = signature
+        self.run = run
+        self.nbytes = nbytes
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.users = 0        # 대기 + 추론 중인 요청 수 (0 일 때만 내릴 수 있음)
+        self.requests = 0
+        self.loaded_at = time.time()
+        self.last_used = time.monotonic()
+
+
+class ModelPool:
+    def __init__(self, loader, rss_budget_bytes, idle_seconds=600, max_concurrency=2, max_waiting=16):
+        self.loader = loader                    # loader(model_dir) -> run(texts, parameters)
+        self.rss_budget = int(rss_budget_bytes)
+        self.idle_seconds = float(idle_seconds)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_waiting = max(0, int(max_waiting))
+        self._entries = OrderedDict()           # name -> _Entry (앞쪽이 오래 안 쓴 모델)
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()      # 로딩은 한 번에 하나 (RSS 측정이 섞이지 않게)
+        self._loading = {}                      # name -> asyncio.Future (같은 모델 중복 로딩 방지)
+        self.loads = 0
+        self.evictions = 0
+        self.idle_unloads = 0
+
+    # --- 메모리 관리 ---
+    def _used_bytes(self):
+        rss = current_rss()
+        if rss is not None:
+            return rss
+        return sum(e.nbytes for e in self._entries.values())
+
+    def _evict(self, name):
+        # self._lock 을 잡은 상태에서 호출합니다.
+        entry = self._entries.pop(name)
+        entry.run = None
+        return entry
+
+    def _make_room(self, needed):
+        """needed 바이트를 올릴 수 있을 때까지 안 쓰는 모델을 LRU 순서로 내립니다."""
+        while self._used_bytes() + needed > self.rss_budget:
+            with self._lock:
+                victim = next((name for name, e in self._entries.items() if e.users == 0), None)
+                if victim is None:
+                    # 올라간 모델이 없는데도 넘으면 예산이 프로세스 기본 크기보다 작은 것이므로 그냥 올립니다.
+                    return not self._entries
+                self._evict(victim)
+                self.evictions += 1
+            _release_memory()
+        return True
+
+    def unload_idle(self, now=None):
+        """idle_seconds 동안 안 쓴 모델을 내리고 내린 수를 돌려줍니다. (sweep 스레드에서 호출)"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            idle = [name for name, e in self._entries.items()
+                    if e.users == 0 and now - e.last_used > self.idle_seconds]
+            for name in idle:
+                self._evict(name)
+            self.idle_unloads += len(idle)
+        if idle:
+            _release_memory()
+        return len(idle)
+
+    # --- 로딩 ---
+    def _load_blocking(self, name, model_dir, signature):
+        with self._load_lock:
+            with self._lock:
+                stale = self._entries.get(name)
+                if stale is not None and stale.users == 0 and stale.signature != signature:
+                    self._evict(name)
+            if not self._make_room(estimate_model_bytes(model_dir)):
+                raise PoolExhausted()
+            before = current_rss()
+            try:
+                run = self.loader(model_dir)
+            except Exception as e:
+                raise ModelNotServable(str(e)) from e
+            after = current_rss()
+            nbytes = max(after - before, 0) if before is not None and after is not None else 0
+            nbytes = max(nbytes, estimate_model_bytes(model_dir))
+            self.loads += 1
+            return _Entry(name, signature, run, nbytes, self.max_concurrency)
+
+    async def _get(self, name):
+        model_dir = repo_dir("models", name)
+        if not os.path.exists(os.path.join(model_dir, "config.json")):
+            raise ModelNotServable("config.json 이 없습니다.")
+        signature = os.stat(model_dir).st_mtime_ns
+        while True:
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is not None and entry.signature == signature:
+                    self._entries.move_to_end(name)
+                    entry.users += 1
+                    return entry
+
+            # 같은 모델을 동시에 요청하면 첫 요청만 로딩하고, 나머지는 기다렸다가 위에서 다시 찾습니다.
+            pending = self._loading.get(name)
+            if pending is not None:
+                await asyncio.shield(pending)
+                continue
+            pending = asyncio.get_running_loop().create_future()
+            self._loading[name] = pending
+            try:
+                entry = await run_in_threadpool(self._load_blocking, name, model_dir, signature)
+                with self._lock:
+                    entry.users += 1
+                    self._entries[name] = entry
+                    self._entries.move_to_end(name)
+                pending.set_result(None)
+                return entry
+            except Exception as e:
+                pending.set_exception(e)
+                pending.exception()     # 기다리는 요청이 없어도 경고가 뜨지 않게
+                raise
+            except BaseException:
+                # 로딩하던 요청이 취소되면 기다리던 요청 중 하나가 다시 로딩합니다.
+                pending.set_result(None)
+                raise
+            finally:
+                self._loading.pop(name, None)
+
+    @asynccontextmanager
+    async def use(self, name):
+        """async with pool.use(name) as run: 모델을 (필요하면 불러와서) 동시성 제한 안에서 빌려줍니다."""
+        entry = await self._get(name)
+        try:
+            if entry.users > self.max_concurrency + self.max_waiting:
+                raise ModelBusy()
+            async with entry.semaphore:
+                entry.requests += 1
+                yield entry.run
+        finally:
+            with self._lock:
+                entry.users -= 1
+                entry.last_used = time.monotonic()
+
+    def unload(self, name):
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry.users:
+                return False
+            self._evict(name)
+        _release_memory()
+        return True
+
+    def stats(self):
+        with self._lock:
+            models = [{
+                "name": e.name, "bytes": e.nbytes, "in_use": e.users, "requests": e.requests,
+                "loaded_at": e.loaded_at, "idle_seconds": round(time.monotonic() - e.last_used, 1),
+            } for e in self._entries.values()]
+        return {
+            "rss_bytes": current_rss(),
+            "rss_budget_bytes": self.rss_budget,
+            "idle_unload_seconds": self.idle_seconds,
+            "max_concurrency": self.max_concurrency,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "idle_unloads": self.idle_unloads,
+            "models": models,
+        }
@@ -0,0 +1,72 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+# ==========================================
+# 샘플링 프로파일러 (관리자 요청으로 N 초 동안만)
+# ==========================================
+# interval 마다 sys._current_frames() 로 모든 스레드의 스택을 떠서 같은 스택끼리 셉니다.
+# 결과는 "스레드;바깥 함수;...;안쪽 함수 횟수" 한 줄씩인 collapsed stack 형식이라
+# flamegraph.pl / speedscope / inferno 에 그대로 넣을 수 있습니다.
+MAX_PROFILE_SECONDS = 60
+# 스택 맨 위가 이 (파일, 함수) 면 잠든(대기 중인) 스레드로 보고 기본적으로 뺍니다.
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("connection.py", "_poll"),
+    ("socket.py", "accept"),
+}
+
+
+class ProfilerBusy(Exception):
+    pass
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.last_run = None
+
+    def profile(self, seconds, interval_ms=5.0, include_idle=False):
+        """seconds 동안 샘플링하고 collapsed stack 텍스트를 돌려줍니다. 이미 돌고 있으면 ProfilerBusy."""
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusy()
+        try:
+            return self._run(min(float(seconds), MAX_PROFILE_SECONDS), max(1.0, float(interval_ms)) / 1000.0,
+                             include_idle)
+        finally:
+            self._lock.release()
+
+    def _run(self, seconds, interval, include_idle):
+        me = threading.get_ident()
+        stacks = Counter()
+        samples = 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                code = frame.f_code
+                if not include_idle and (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(ident, f"thread-{ident}"))
+                stacks[";".join(reversed(labels))] += 1
+            samples += 1
+            time.sleep(interval)
+        self.last_run = {"seconds": seconds, "interval_ms": interval * 1000.0, "samples": samples,
+                         "stacks": len(stacks), "finished_at": time.time()}
+        return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
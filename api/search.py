@@ -0,0 +1,219 @@
+import bisect
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+
+from sqlalchemy import func, literal, literal_column, text
+
+from database import AIModel, Dataset
+from listing import apply_filters, normalize_tag
+
+# ==========================================
+# 모델 / 데이터셋 검색 (이름, 태그, README)
+# ==========================================
+# PostgreSQL 이면 tsvector + GIN 인덱스로 DB 가 검색하고,
+# 그 외(SQLite 테스트 환경 등)에는 프로세스 안의 역색인을 씁니다.
+SEARCH_TABLES = {"models": AIModel, "datasets": Dataset}
+FACET_SAMPLE_LIMIT = 1000
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    return [t.lower() for t in _TOKEN_RE.findall(text or "")]
+
+
+def split_tags(tags):
+    return [t.strip() for t in (tags or "").split(",") if t.strip()]
+
+
+def _hit(kind, row, score):
+    return {
+        "type": kind,
+        "name": row.name,
+        "author": row.author,
+        "tags": split_tags(row.tags),
+        "score": round(float(score), 4),
+    }
+
+
+# ------------------------------------------
+# PostgreSQL: tsvector + GIN
+# ------------------------------------------
+def _sql(value):
+    # 인덱스 식과 쿼리 식이 글자 그대로 같아야 GIN 인덱스를 타므로 바인드 파라미터 대신 리터럴을 씁니다.
+    return literal_column(value)
+
+
+def _pg_vector(table):
+    # 이름 > 태그 > README 순으로 가중치
+    def weighted(column, weight):
+        return func.setweight(func.to_tsvector(_sql("'simple'::regconfig"), column), _sql(f"'{weight}'"))
+
+    return (
+        weighted(func.coalesce(table.name, _sql("''")), "A")
+        .op("||")(weighted(func.replace(func.coalesce(table.tags, _sql("''")), _sql("','"), _sql("' '")), "B"))
+        .op("||")(weighted(func.coalesce(table.readme, _sql("''")), "C"))
+    )
+
+
+class PostgresSearch:
+    name = "postgres"
+
+    def ensure_indexes(self, engine):
+        with engine.begin() as conn:
+            for table in SEARCH_TABLES.values():
+                expr = str(_pg_vector(table).compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table.__tablename__}_search "
+                    f"ON {table.__tablename__} USING GIN (({expr}))"
+                ))
+
+    def rebuild(self, db):
+        pass
+
+    def index(self, kind, row):
+        pass  # DB 인덱스가 INSERT/UPDATE 때 자동으로 갱신됩니다.
+
+    def remove(self, kind, name):
+        pass
+
+    def search(self, db, q, kinds, tag=None, limit=20, offset=0):
+        terms = tokenize(q)
+        if not terms:
+            return [], 0, {}
+        # 모든 단어를 AND 로 묶고 각 단어는 접두어 매칭 ("bert:*")
+        tsquery = func.to_tsquery(_sql("'simple'::regconfig"), literal(" & ".join(f"{t}:*" for t in terms)))
+
+        hits, total, facets = [], 0, Counter()
+        for kind in kinds:
+            table = SEARCH_TABLES[kind]
+            vector = _pg_vector(table)
+            query = db.query(table, func.ts_rank_cd(vector, tsquery).label("rank")).filter(vector.op("@@")(tsquery))
+            query = apply_filters(query, table, tag=tag)
+            total += query.count()
+            for row, rank in query.order_by(text("rank DESC"), table.id.desc()).limit(offset + limit).all():
+                hits.append(_hit(kind, row, rank))
+            for (tags,) in query.with_entities(table.tags).limit(FACET_SAMPLE_LIMIT).all():
+                facets.update(split_tags(tags))
+
+        hits.sort(key=lambda h: h["score"], reverse=True)
+        return hits[offset:offset + limit], total, dict(facets.most_common(30))
+
+
+# ------------------------------------------
+# 프로세스 내 역색인 (SQLite / 테스트용)
+# ------------------------------------------
+FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "readme": 1.0}
+
+
+class InvertedIndexSearch:
+    name = "inverted-index"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = defaultdict(dict)  # term -> {doc_key: weight}
+        self._vocab = []                     # 접두어 검색용 정렬된 단어 목록
+        self._docs = {}                      # doc_key -> (row 요약, term 목록)
+
+    def ensure_indexes(self, engine):
+        pass
+
+    def rebuild(self, db):
+        for kind, table in SEARCH_TABLES.items():
+            for row in db.query(table).all():
+                self.index(kind, row)
+
+    def index(self, kind, row):
+        key = (kind, row.name)
+        weights = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            value = getattr(row, field)
+            if field == "tags":
+                value = " ".join(split_tags(value))
+            for term in tokenize(value):
+                weights[term] += weight
+        summary = {"name": row.name, "author": row.author, "tags": row.tags}
+
+        with self._lock:
+            self._remove_locked(key)
+            for term, weight in weights.items():
+                if term not in self._postings:
+                    bisect.insort(self._vocab, term)
+                self._postings[term][key] = weight
+            self._docs[key] = (summary, list(weights))
+
+    def remove(self, kind, name):
+        with self._lock:
+            self._remove_locked((kind, name))
+
+    def _remove_locked(self, key):
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        for term in doc[1]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[term]
+                i = bisect.bisect_left(self._vocab, term)
+                if i < len(self._vocab) and self._vocab[i] == term:
+                    del self._vocab[i]
+
+    def _expand(self, prefix):
+        i = bisect.bisect_left(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            yield self._vocab[i]
+            i += 1
+
+    def search(self, db, q, kinds, tag=None, limit=20, offset=0):
+        terms = tokenize(q)
+        if not terms:
+            return [], 0, {}
+
+        with self._lock:
+            n_docs = max(1, len(self._docs))
+            scores = None
+            for term in terms:
+                # 접두어가 같은 단어들을 모두 모아서 점수 합산 (idf 가중)
+                term_scores = defaultdict(float)
+                for word in self._expand(term):
+                    postings = self._postings[word]
+                    idf = math.log(1 + n_docs / len(postings))
+                    for key, weight in postings.items():
+                        term_scores[key] = max(term_scores[key], weight * idf)
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {k: v + term_scores[k] for k, v in scores.items() if k in term_scores}
+                if not scores:
+                    return [], 0, {}
+
+            matched = []
+            for key, score in scores.items():
+                kind, _ = key
+                summary = self._docs[key][0]
+                if kind not in kinds:
+                    continue
+                if tag and normalize_tag(tag) not in [normalize_tag(t) for t in split_tags(summary["tags"])]:
+                    continue
+                matched.append((score, kind, summary))
+
+        matched.sort(key=lambda m: (-m[0], m[2]["name"]))
+        facets = Counter()
+        for _, _, summary in matched[:FACET_SAMPLE_LIMIT]:
+            facets.update(split_tags(summary["tags"]))
+        hits = [
+            {"type": kind, "name": s["name"], "author": s["author"], "tags": split_tags(s["tags"]), "score": round(score, 4)}
+            for score, kind, s in matched[offset:offset + limit]
+        ]
+        return hits, len(matched), dict(facets.most_common(30))
+
+
+def make_search_service(engine):
+    if engine.dialect.name == "postgresql":
+        return PostgresSearch()
+    return InvertedIndexSearch()
@@ -0,0 +1,141 @@
+import os
+from datetime import datetime
+
+from database import StorageStats
+from listing import bump_listing_version
+from metrics import STORAGE_SCAN_SECONDS
+
+# ==========================================
+# 저장소 폴더 메타데이터 (용량 / 파일 수 / 대표 타입)
+# ==========================================
+# 업로드/삭제 때 갱신하고, 그 밖의 변경은 주기적으로 폴더 mtime 만 비교해서 잡아냅니다.
+# 목록 API 는 storage_stats 테이블만 읽고 파일 시스템은 건드리지 않습니다.
+STORAGE_ROOT = os.getenv("STORAGE_ROOT", "./storage")
+# 업로드 중인 임시 파일 접두어 (용량 집계와 파일 목록에서 뺍니다)
+UPLOAD_TEMP_PREFIX = ".upload-"
+
+
+def repo_dir(kind, name):
+    return os.path.join(STORAGE_ROOT, kind, name)
+
+
+def scan_dir(target_dir):
+    """폴더 안 파일들의 (총 용량, 파일 수, 가장 큰 파일의 확장자) 를 돌려줍니다."""
+    with STORAGE_SCAN_SECONDS.time():
+        return _scan_dir(target_dir)
+
+
+def _scan_dir(target_dir):
+    total_size = 0
+    file_count = 0
+    largest_ext = ""
+    max_size = 0
+    try:
+        entries = list(os.scandir(target_dir))
+    except FileNotFoundError:
+        return 0, 0, ""
+
+    for entry in entries:
+        if not entry.is_file() or entry.name.startswith(UPLOAD_TEMP_PREFIX):
+            continue
+        sz = entry.stat().st_size
+        total_size += sz
+        file_count += 1
+        if sz > max_size:
+            max_size = sz
+            largest_ext = os.path.splitext(entry.name)[1].lower()
+    return total_size, file_count, largest_ext
+
+
+def format_size(total_size):
+    # 예쁜 용량 텍스트로 변환 (KB, MB, GB)
+    if total_size == 0:
+        return "0 MB"
+    if total_size < 1024 * 1024:
+        return f"{total_size / 1024:.1f} KB"
+    if total_size < 1024 * 1024 * 1024:
+        return f"{total_size / (1024 * 1024):.1f} MB"
+    return f"{total_size / (1024 * 1024 * 1024):.2f} GB"
+
+
+def describe_type(largest_ext, default_type):
+    # 가장 큰 파일 확장자를 기준으로 타입 결정!
+    if not largest_ext:
+        return default_type
+    if largest_ext in ['.pt', '.pth']: return "PyTorch (.pt)"
+    if largest_ext == '.safetensors': return "Safetensors"
+    if largest_ext == '.bin': return "Binary (.bin)"
+    if largest_ext == '.csv': return "CSV Data"
+    if largest_ext == '.json': return "JSON Data"
+    if largest_ext == '.txt': return "Text Data"
+    if largest_ext == '.zip': return "ZIP Archive"
+    return f"{largest_ext.upper()[1:]} File"
+
+
+def describe_storage(stats, default_type):
+    """storage_stats 행(없으면 None) 을 목록 화면용 (용량 텍스트, 타입 텍스트) 로 바꿉니다."""
+    if stats is None:
+        return "0 MB", default_type
+    return format_size(stats.total_size), describe_type(stats.largest_ext, default_type)
+
+
+def _dir_mtime_ns(target_dir):
+    try:
+        return os.stat(target_dir).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def refresh_storage_stats(db, kind, name):
+    """폴더를 다시 스캔해서 storage_stats 를 갱신합니다. (commit 은 호출한 쪽에서)"""
+    target_dir = repo_dir(kind, name)
+    mtime_ns = _dir_mtime_ns(target_dir)
+    stats = db.get(StorageStats, (kind, name))
+    if mtime_ns is None:
+        if stats is not None:
+            db.delete(stats)
+        return None
+
+    total_size, file_count, largest_ext = scan_dir(target_dir)
+    if stats is None:
+        stats = StorageStats(kind=kind, name=name)
+        db.add(stats)
+    stats.total_size = total_size
+    stats.file_count = file_count
+    stats.largest_ext = largest_ext
+    stats.dir_mtime_ns = mtime_ns
+    stats.updated_at = datetime.utcnow()
+    return stats
+
+
+def delete_storage_stats(db, kind, name):
+    db.query(StorageStats).filter(StorageStats.kind == kind, StorageStats.name == name).delete()
+
+
+def get_storage_stats(db, kind, names):
+    """이름 목록에 해당하는 storage_stats 를 한 번의 쿼리로 가져옵니다. {name: StorageStats}"""
+    if not names:
+        return {}
+    rows = db.query(StorageStats).filter(StorageStats.kind == kind, StorageStats.name.in_(list(names))).all()
+    return {row.name: row for row in rows}
+
+
+def refresh_stale_storage_stats(db):
+    """폴더 mtime 이 바뀐 저장소만 다시 스캔합니다. 갱신한 개수를 돌려줍니다."""
+    refreshed = 0
+    for kind in ("models", "datasets"):
+        known = {row.name: row.dir_mtime_ns for row in db.query(StorageStats).filter(StorageStats.kind == kind)}
+        try:
+            on_disk = [e.name for e in os.scandir(os.path.join(STORAGE_ROOT, kind)) if e.is_dir()]
+        except FileNotFoundError:
+            on_disk = []
+        changed = 0
+        for name in set(on_disk) | set(known):
+            if known.get(name) != _dir_mtime_ns(repo_dir(kind, name)):
+                refresh_storage_stats(db, kind, name)
+                changed += 1
+        if changed:
+            bump_listing_version(db, kind)
+        refreshed += changed
+    db.commit()
+    return refreshed
@@ -0,0 +1,330 @@
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+# ==========================================
+# 게이트웨이 텔레메트리 (메모리 내 시계열 + 롤업)
+# ==========================================
+# 게이트웨이마다 고정 크기 링 버퍼를 두되, dict 대신 전체 게이트웨이가 함께 쓰는 평평한 array 에
+# "슬롯 번호 x 칸" 위치로 저장합니다. (게이트웨이 하나에 수 KB, 파이썬 객체 없음)
+# 하트비트가 들어올 때마다 온라인 수와 자원 사용률 합계를 증감해 두므로 요약 조회는 O(1) 이고,
+# 오프라인 판정은 마지막 하트비트 순서로 정렬된 목록의 앞쪽만 보면 됩니다.
+METRICS = ("cpu", "memory", "flash")
+# 롤업 해상도 이름 -> 버킷 길이(초)
+ROLLUP_SECONDS = {"1m": 60, "5m": 300, "1h": 3600}
+DEFAULT_ROLLUP_BUCKETS = {"1m": 60, "5m": 72, "1h": 48}   # 1시간 / 6시간 / 2일
+
+
+def format_uptime(seconds):
+    minutes = int(seconds) // 60
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f"{days}d {hours}h {minutes}m"
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+def _zeros(typecode, n):
+    return array(typecode, bytes(array(typecode).itemsize * n))
+
+
+class _Rollup:
+    """한 해상도의 버킷 링. 슬롯마다 buckets 칸이 있고, 칸마다 버킷 번호를 같이 저장해서
+    오래된 칸은 쓰거나 읽을 때 알아봅니다. (시간이 지났다고 전체를 지우는 작업이 없습니다)"""
+
+    def __init__(self, seconds, buckets):
+        self.seconds = seconds
+        self.buckets = buckets
+        m = len(METRICS)
+        self.sums = array("f")        # slot, bucket, metric
+        self.counts = array("H")      # slot, bucket
+        self.ids = array("i")         # slot, bucket -> 버킷 번호 (ts // seconds)
+        # 전체 게이트웨이 합계 (자원 사용률 평균 + 버킷 동안 최대 온라인 수)
+        self.fleet_sums = _zeros("d", buckets * m)
+        self.fleet_counts = _zeros("I", buckets)
+        self.fleet_online = _zeros("I", buckets)
+        self.fleet_ids = _zeros("i", buckets)
+
+    def add_slot(self):
+        self.sums.extend(_zeros("f", self.buckets * len(METRICS)))
+        self.counts.extend(_zeros("H", self.buckets))
+        self.ids.extend(_zeros("i", self.buckets))
+
+    def add(self, slot, ts, values, online):
+        m = len(METRICS)
+        bucket_id = int(ts // self.seconds)
+        pos = bucket_id % self.buckets
+        cell = slot * self.buckets + pos
+        if self.ids[cell] != bucket_id:
+            self.ids[cell] = bucket_id
+            self.counts[cell] = 0
+            for i in range(m):
+                self.sums[cell * m + i] = 0.0
+        if self.counts[cell] < 0xFFFF:
+            self.counts[cell] += 1
+            for i, v in enumerate(values):
+                self.sums[cell * m + i] += v
+
+        if self.fleet_ids[pos] != bucket_id:
+            self.fleet_ids[pos] = bucket_id
+            self.fleet_counts[pos] = 0
+            self.fleet_online[pos] = 0
+            for i in range(m):
+                self.fleet_sums[pos * m + i] = 0.0
+        self.fleet_counts[pos] += 1
+        for i, v in enumerate(values):
+            self.fleet_sums[pos * m + i] += v
+        self.fleet_online[pos] = max(self.fleet_online[pos], online)
+
+    def series(self, slot, now):
+        """slot 이 None 이면 전체 평균. 오래된 순서로 값이 있는 버킷만 돌려줍니다."""
+        m = len(METRICS)
+        current = int(now // self.seconds)
+        points = []
+        for bucket_id in range(current - self.buckets + 1, current + 1):
+            pos = bucket_id % self.buckets
+            if slot is None:
+                if self.fleet_ids[pos] != bucket_id or not self.fleet_counts[pos]:
+                    continue
+                n, base, sums = self.fleet_counts[pos], pos * m, self.fleet_sums
+                point = {"ts": bucket_id * self.seconds, "online": self.fleet_online[pos]}
+            else:
+                cell = slot * self.buckets + pos
+                if self.ids[cell] != bucket_id or not self.counts[cell]:
+                    continue
+                n, base, sums = self.counts[cell], cell * m, self.sums
+                point = {"ts": bucket_id * self.seconds, "samples": n}
+            for i, name in enumerate(METRICS):
+                point[name] = round(sums[base + i] / n, 1)
+            points.append(point)
+        return points
+
+
+class GatewayTelemetry:
+    def __init__(self, offline_after_seconds=90.0, raw_samples=60, rollup_buckets=None):
+        self.offline_after = float(offline_after_seconds)
+        self.raw_samples = max(1, int(raw_samples))
+        buckets = {**DEFAULT_ROLLUP_BUCKETS, **(rollup_buckets or {})}
+        self._lock = threading.Lock()
+
+        # 게이트웨이 id -> 슬롯 번호, 슬롯별 문자열 속성
+        self._slots = {}
+        self._ids = []
+        self._locations = []
+        self._fw_versions = []
+        self._app_versions = []
+        # 슬롯별 최신 값
+        self._current = array("f")     # slot, metric
+        self._sensors = array("I")
+        self._last_seen = array("d")
+        self._booted_at = array("d")
+        self._online = array("b")
+        # 슬롯별 원본 샘플 링 버퍼
+        self._raw_ts = array("d")      # slot, pos
+        self._raw = array("f")         # slot, pos, metric
+        self._raw_next = array("I")    # slot -> 다음에 쓸 위치
+        self._rollups = {name: _Rollup(ROLLUP_SECONDS[name], max(1, int(buckets[name]))) for name in ROLLUP_SECONDS}
+
+        # 온라인 게이트웨이를 마지막 하트비트 순서로 (가장 오래된 것이 앞)
+        self._by_last_seen = OrderedDict()
+        # 온라인 게이트웨이 수와 지표 합계 (증분 유지)
+        self._online_count = 0
+        self._online_sums = [0.0] * len(METRICS)
+        self.heartbeats = 0
+
+    # --- 쓰기 ---
+    def _add_slot(self, gateway_id):
+        slot = len(self._ids)
+        self._slots[gateway_id] = slot
+        self._ids.append(gateway_id)
+        self._locations.append("")
+        self._fw_versions.append("")
+        self._app_versions.append("")
+        self._current.extend(_zeros("f", len(METRICS)))
+        self._sensors.append(0)
+        self._last_seen.append(0.0)
+        self._booted_at.append(0.0)
+        self._online.append(0)
+        self._raw_ts.extend(_zeros("d", self.raw_samples))
+        self._raw.extend(_zeros("f", self.raw_samples * len(METRICS)))
+        self._raw_next.append(0)
+        for rollup in self._rollups.values():
+            rollup.add_slot()
+        return slot
+
+    def ingest(self, heartbeats, now=None):
+        """하트비트 목록(dict: id, cpu, memory, flash, sensors, fw_ver, app_ver, location, uptime_seconds)
+        을 반영하고 (받은 수, 새로 등록된 게이트웨이 수) 를 돌려줍니다. 시각은 서버가 받은 시각입니다."""
+        now = time.time() if now is None else now
+        m = len(METRICS)
+        created = 0
+        with self._lock:
+            for hb in heartbeats:
+                slot = self._slots.get(hb["id"])
+                if slot is None:
+                    slot = self._add_slot(hb["id"])
+                    created += 1
+                values = [float(hb[name]) for name in METRICS]
+
+                # 요약 합계: 온라인이었으면 이전 값을 빼고 새 값을 더합니다.
+                if self._online[slot]:
+                    for i in range(m):
+                        self._online_sums[i] -= self._current[slot * m + i]
+                else:
+                    self._online[slot] = 1
+                    self._online_count += 1
+                for i, v in enumerate(values):
+                    self._online_sums[i] += v
+                    self._current[slot * m + i] = v
+                self._by_last_seen[slot] = None
+                self._by_last_seen.move_to_end(slot)
+
+                self._last_seen[slot] = now
+                uptime = hb.get("uptime_seconds")
+                if uptime is not None:
+                    self._booted_at[slot] = now - float(uptime)
+                elif not self._booted_at[slot]:
+                    self._booted_at[slot] = now
+                self._sensors[slot] = int(hb.get("sensors") or 0)
+                for attr, key in ((self._locations, "location"), (self._fw_versions, "fw_ver"),
+                                  (self._app_versions, "app_ver")):
+                    if hb.get(key) is not None:
+                        attr[slot] = hb[key]
+
+                pos = self._raw_next[slot]
+                self._raw_ts[slot * self.raw_samples + pos] = now
+                for i, v in enumerate(values):
+                    self._raw[(slot * self.raw_samples + pos) * m + i] = v
+                self._raw_next[slot] = (pos + 1) % self.raw_samples
+
+                for rollup in self._rollups.values():
+                    rollup.add(slot, now, values, self._online_count)
+            self.heartbeats += len(heartbeats)
+        return len(heartbeats), created
+
+    def mark_offline(self, now=None):
+        """마지막 하트비트가 offline_after 보다 오래된 게이트웨이를 오프라인으로 바꾸고 그 수를 돌려줍니다."""
+        now = time.time() if now is None else now
+        cutoff = now - self.offline_after
+        m = len(METRICS)
+        changed = 0
+        with self._lock:
+            while self._by_last_seen:
+                slot = next(iter(self._by_last_seen))
+                if self._last_seen[slot] >= cutoff:
+                    break
+                del self._by_last_seen[slot]
+                self._online[slot] = 0
+                self._online_count -= 1
+                for i in range(m):
+                    self._online_sums[i] -= self._current[slot * m + i]
+                changed += 1
+            if not self._online_count:
+                # 부동소수점 오차가 쌓이지 않게 온라인이 없으면 합계를 0 으로 맞춥니다.
+                self._online_sums = [0.0] * m
+        return changed
+
+    # --- 읽기 ---
+    def summary(self):
+        with self._lock:
+            total, online = len(self._ids), self._online_count
+            averages = [s / online if online else 0.0 for s in self._online_sums]
+        result = {"total": total, "online": online, "offline": total - online}
+        for name, avg in zip(METRICS, averages):
+            result[f"avg_{name}"] = round(max(avg, 0.0), 1)
+        return result
+
+    def _device(self, slot, now):
+        m = len(METRICS)
+        online = bool(self._online[slot])
+        device = {
+            "id": self._ids[slot],
+            "location": self._locations[slot],
+            "status": "Online" if online else "Offline",
+            "uptime": format_uptime(now - self._booted_at[slot]) if online else "0m",
+            "last_seen": round(self._last_seen[slot], 3),
+            "fw_ver": self._fw_versions[slot],
+            "app_ver": self._app_versions[slot],
+            "sensors": self._sensors[slot] if online else 0,
+        }
+        for i, name in enumerate(METRICS):
+            device[name] = round(self._current[slot * m + i], 1) if online else 0
+        return device
+
+    def devices(self, offset=0, limit=100, status=None, now=None):
+        """등록 순서로 (devices, next_offset). status 는 None / "online" / "offline"."""
+        now = time.time() if now is None else now
+        with self._lock:
+            if status is None:
+                slots = range(offset, min(offset + limit + 1, len(self._ids)))
+            else:
+                wanted = 1 if status == "online" else 0
+                slots, skipped = [], 0
+                for slot in range(len(self._ids)):
+                    if self._online[slot] != wanted:
+                        continue
+                    if skipped < offset:
+                        skipped += 1
+                        continue
+                    slots.append(slot)
+                    if len(slots) > limit:
+                        break
+            devices = [self._device(slot, now) for slot in slots]
+        next_offset = offset + limit if len(devices) > limit else None
+        return devices[:limit], next_offset
+
+    def device(self, gateway_id, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            slot = self._slots.get(gateway_id)
+            return None if slot is None else self._device(slot, now)
+
+    def series(self, gateway_id=None, resolution="1m", now=None):
+        """gateway_id 가 None 이면 전체 평균. resolution 은 "raw" 또는 ROLLUP_SECONDS 의 키.
+        없는 게이트웨이면 None, 잘못된 resolution 이면 ValueError."""
+        now = time.time() if now is None else now
+        if resolution != "raw" and resolution not in ROLLUP_SECONDS:
+            raise ValueError(resolution)
+        if resolution == "raw" and gateway_id is None:
+            raise ValueError(resolution)
+        m = len(METRICS)
+        with self._lock:
+            slot = None
+            if gateway_id is not None:
+                slot = self._slots.get(gateway_id)
+                if slot is None:
+                    return None
+            if resolution != "raw":
+                return self._rollups[resolution].series(slot, now)
+            points = []
+            start = self._raw_next[slot]
+            for k in range(self.raw_samples):
+                pos = (start + k) % self.raw_samples
+                ts = self._raw_ts[slot * self.raw_samples + pos]
+                if not ts:
+                    continue
+                point = {"ts": round(ts, 3)}
+                for i, name in enumerate(METRICS):
+                    point[name] = round(self._raw[(slot * self.raw_samples + pos) * m + i], 1)
+                points.append(point)
+            return points
+
+    def stats(self):
+        with self._lock:
+            gateways = len(self._ids)
+            arrays = [self._current, self._sensors, self._last_seen, self._booted_at, self._online,
+                      self._raw_ts, self._raw, self._raw_next]
+            for rollup in self._rollups.values():
+                arrays += [rollup.sums, rollup.counts, rollup.ids]
+            nbytes = sum(a.itemsize * len(a) for a in arrays)
+        return {
+            "gateways": gateways,
+            "heartbeats": self.heartbeats,
+            "raw_samples": self.raw_samples,
+            "rollup_buckets": {name: r.buckets for name, r in self._rollups.items()},
+            "series_bytes": nbytes,
+            "offline_after_seconds": self.offline_after,
+        }
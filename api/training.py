@@ -0,0 +1,182 @@
+import os
+import time
+from datetime import datetime
+
+import torch
+import torch.nn as nn
+import torch.optim as optim
+from torch.utils.data import BatchSampler, DataLoader, Dataset, RandomSampler
+from torchvision import datasets, transforms
+
+
+# ==========================================
+# AI 학습 (MNIST) 로직 - 작업자 프로세스 안에서 실행됩니다
+# ==========================================
+MODEL_DIR = "./models"
+# 최신 체크포인트 (/predict/mnist 의 version=latest) 와 버전별 보관 폴더
+MNIST_CHECKPOINT = os.path.join(MODEL_DIR, "mnist_model.pt")
+MNIST_VERSION_DIR = os.path.join(MODEL_DIR, "mnist")
+DATA_DIR = "./data"
+MNIST_MEAN, MNIST_STD = 0.1307, 0.3081
+
+
+class TrainingCancelled(Exception):
+    pass
+
+
+def get_device():
+    if torch.cuda.is_available():
+        return torch.device("cuda:0")
+    return torch.device("cpu")
+
+
+def build_mnist_model():
+    return nn.Sequential(
+        nn.Flatten(),
+        nn.Linear(28*28, 128),
+        nn.ReLU(),
+        nn.Linear(128, 10)
+    )
+
+
+# ------------------------------------------
+# 빠른 입력 파이프라인: 한 번 디코딩/정규화한 텐서를 파일로 캐시하고 mmap 으로 재사용
+# ------------------------------------------
+def load_cached_mnist(root=DATA_DIR):
+    cache_path = os.path.join(root, "mnist_train_normalized.pt")
+    if not os.path.exists(cache_path):
+        raw = datasets.MNIST(root, train=True, download=True)
+        # ToTensor + Normalize 와 같은 계산을 데이터셋 전체에 한 번만 적용
+        images = raw.data.to(torch.float32).div_(255.0).sub_(MNIST_MEAN).div_(MNIST_STD).unsqueeze(1).contiguous()
+        targets = raw.targets.to(torch.long).contiguous()
+        tmp_path = f"{cache_path}.tmp-{os.getpid()}"
+        torch.save({"images": images, "targets": targets}, tmp_path)
+        os.replace(tmp_path, cache_path)
+    cached = torch.load(cache_path, mmap=True)
+    return cached["images"], cached["targets"]
+
+
+class TensorBatchDataset(Dataset):
+    """인덱스 리스트를 받아 배치 전체를 한 번의 텐서 인덱싱으로 꺼내는 데이터셋."""
+
+    def __init__(self, images, targets):
+        self.images = images
+        self.targets = targets
+
+    def __len__(self):
+        return len(self.targets)
+
+    def __getitem__(self, indices):
+        idx = torch.as_tensor(indices)
+        return self.images[idx], self.targets[idx]
+
+
+def build_train_loader(batch_size, fast_pipeline, num_workers, pin_memory):
+    if not fast_pipeline:
+        transform = transforms.Compose([
+            transforms.ToTensor(),
+            transforms.Normalize((MNIST_MEAN,), (MNIST_STD,))
+        ])
+        dataset = datasets.MNIST(DATA_DIR, train=True, download=True, transform=transform)
+        return DataLoader(dataset, batch_size=batch_size, shuffle=True,
+                          num_workers=num_workers, pin_memory=pin_memory)
+
+    dataset = TensorBatchDataset(*load_cached_mnist())
+    sampler = BatchSampler(RandomSampler(dataset), batch_size=batch_size, drop_last=False)
+    return DataLoader(dataset, sampler=sampler, batch_size=None, num_workers=num_workers,
+                      pin_memory=pin_memory, persistent_workers=num_workers > 0)
+
+
+def save_mnist_checkpoint(state_dict):
+    """버전 폴더에 저장한 뒤 최신 체크포인트를 통째로 바꿔치기합니다.
+
+    서버는 파일의 mtime 이 바뀌면 다시 읽으므로, 쓰는 도중의 파일을 읽지 않도록
+    임시 파일에 쓰고 os.replace 로 교체합니다. (version, 버전 파일 경로) 를 돌려줍니다.
+    """
+    os.makedirs(MNIST_VERSION_DIR, exist_ok=True)
+    version = datetime.now().strftime("%Y%m%d-%H%M%S")
+    version_path = os.path.join(MNIST_VERSION_DIR, f"{version}.pt")
+    for path in (version_path, MNIST_CHECKPOINT):
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        torch.save(state_dict, tmp_path)
+        os.replace(tmp_path, path)
+    return version, version_path
+
+
+def run_real_training(epochs, batch_size, lr, report, should_stop,
+                      fast_pipeline=False, num_workers=0, pin_memory=False, metrics_every=50):
+    """MNIST 분류기를 학습합니다.
+
+    report(event) 로 진행 상황을 부모 프로세스에 보내고, should_stop() 이 True 가 되면
+    다음 배치에서 TrainingCancelled 를 던지고 멈춥니다.
+    fast_pipeline=True 면 정규화된 텐서 캐시(mmap) + 배치 단위 인덱싱 로더를 씁니다.
+    metrics_every 스텝마다 현재 손실과 처리량을 "metrics" 이벤트로 보냅니다 (0 이면 끔).
+    """
+    def log(message):
+        report({"type": "log", "message": f"[{datetime.now().time()}] {message}"})
+
+    device = get_device()
+    pin_memory = pin_memory and device.type == "cuda"
+    log(f"Real Training Started (MNIST) on {device}...")
+
+    log("Loading cached MNIST tensors..." if fast_pipeline else "Downloading MNIST Dataset...")
+    train_loader = build_train_loader(batch_size, fast_pipeline, num_workers, pin_memory)
+    log(f"Dataset Loaded. Batch Size: {batch_size}, Workers: {num_workers}, Pinned: {pin_memory}")
+
+    model = build_mnist_model().to(device)
+    optimizer = optim.SGD(model.parameters(), lr=lr)
+    criterion = nn.CrossEntropyLoss()
+
+    model.train()
+    total_steps = len(train_loader)
+    global_step = 0
+
+    for epoch in range(1, epochs + 1):
+        # 손실/정답 수는 장치 위에서 누적하고 epoch 끝에서 한 번만 동기화합니다.
+        epoch_loss = torch.zeros((), device=device)
+        correct = torch.zeros((), dtype=torch.long, device=device)
+        total = 0
+        epoch_started = time.perf_counter()
+        window_started, window_samples = epoch_started, 0
+
+        for batch_idx, (data, target) in enumerate(train_loader):
+            if batch_idx % 10 == 0 and should_stop():
+                raise TrainingCancelled()
+
+            data = data.to(device, non_blocking=pin_memory)
+            target = target.to(device, non_blocking=pin_memory)
+            optimizer.zero_grad()
+            output = model(data)
+            loss = criterion(output, target)
+            loss.backward()
+            optimizer.step()
+
+            epoch_loss += loss.detach()
+            correct += output.argmax(dim=1).eq(target).sum()
+            total += target.size(0)
+            global_step += 1
+            window_samples += target.size(0)
+
+            if metrics_every and global_step % metrics_every == 0:
+                # 스트리밍용 스텝 지표 (여기서만 loss 값을 꺼내므로 metrics_every 스텝당 한 번 동기화)
+                now = time.perf_counter()
+                report({
+                    "type": "metrics", "epoch": epoch, "step": global_step,
+                    "loss": round(loss.item(), 4),
+                    "samples_per_sec": round(window_samples / (now - window_started), 1),
+                })
+                window_started, window_samples = now, 0
+
+        acc = 100. * correct.item() / total
+        avg_loss = epoch_loss.item() / total_steps
+        epoch_seconds = time.perf_counter() - epoch_started
+        samples_per_sec = total / epoch_seconds
+        log(f"Epoch {epoch}/{epochs} - Loss: {avg_loss:.4f} - Acc: {acc:.2f}% - {samples_per_sec:.0f} samples/s")
+        report({
+            "type": "progress", "epoch": epoch, "progress": int((epoch / epochs) * 100),
+            "samples_per_sec": round(samples_per_sec, 1), "epoch_seconds": round(epoch_seconds, 3),
+        })
+
+    version, save_path = save_mnist_checkpoint(model.state_dict())
+    log(f"Model saved to {save_path} (version {version})")
+    log("Training Completed Successfully!")
@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from starlette.concurrency import run_in_threadpool
+
+from blobs import BLOB_TMP_DIR, hash_file
+from metrics import observe_transfer
+from storage import STORAGE_ROOT, UPLOAD_TEMP_PREFIX
+
+# ==========================================
+# 파일 업로드 (스트리밍 저장 + 이어받기 세션)
+# ==========================================
+# 모든 디스크 I/O 는 스레드풀에서 하고, 큰 청크 단위로 읽고 쓰면서 SHA-256 을 같이 계산합니다.
+# 받은 내용은 blob 임시 폴더에 쓰고, 다 받은 뒤에 blobs.add_file 이 한 번에 옮겨서 등록하므로
+# 연결이 끊겨도 반쯤 쓴 파일이 저장소에 나타나지 않습니다.
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_BYTES", str(8 * 1024 * 1024)))
+UPLOAD_SESSION_DIR = os.path.join(STORAGE_ROOT, ".uploads")
+UPLOAD_SESSION_TTL_SECONDS = int(os.getenv("UPLOAD_SESSION_TTL_SECONDS", str(24 * 3600)))
+
+
+class UploadError(Exception):
+    """클라이언트에게 그대로 돌려줄 업로드 오류 (status_code 포함)."""
+
+    def __init__(self, status_code, message, **extra):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.extra = extra
+
+
+def safe_filename(filename):
+    # "../../etc/passwd" 같은 경로가 저장소 폴더 밖으로 나가지 않도록 파일 이름만 남깁니다.
+    name = os.path.basename((filename or "").replace("\\", "/"))
+    if name in ("", ".", "..") or name.startswith(UPLOAD_TEMP_PREFIX):
+        raise UploadError(400, "잘못된 파일 이름입니다.")
+    return name
+
+
+def _temp_path():
+    return os.path.join(BLOB_TMP_DIR, uuid.uuid4().hex)
+
+
+def _write_chunk(fp, hasher, chunk):
+    fp.write(chunk)
+    hasher.update(chunk)
+
+
+def _discard(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def save_upload(upload, kind=""):
+    """UploadFile 하나를 임시 파일로 스트리밍 저장하고 (파일 이름, 크기, sha256, 임시 경로) 를 돌려줍니다."""
+    filename = safe_filename(upload.filename)
+    started = time.perf_counter()
+    await run_in_threadpool(os.makedirs, BLOB_TMP_DIR, exist_ok=True)
+    tmp_path = _temp_path()
+    hasher = hashlib.sha256()
+    size = 0
+    fp = await run_in_threadpool(open, tmp_path, "wb")
+    try:
+        while True:
+            chunk = await upload.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            await run_in_threadpool(_write_chunk, fp, hasher, chunk)
+            size += len(chunk)
+        await run_in_threadpool(fp.close)
+    except BaseException:
+        fp.close()
+        await run_in_threadpool(_discard, tmp_path)
+        raise
+    observe_transfer("upload", kind, size, time.perf_counter() - started)
+    return filename, size, hasher.hexdigest(), tmp_path
+
+
+# ------------------------------------------
+# 이어받기 업로드 세션 (init -> PUT 청크(offset) -> complete)
+# ------------------------------------------
+# 세션 상태는 STORAGE_ROOT/.uploads/<id>/ 에 meta.json 과 data.part 로 두므로 서버가 재시작돼도
+# 이어서 올릴 수 있습니다. 다음 청크는 항상 현재 data.part 크기(offset) 에서 시작해야 합니다.
+class UploadSessions:
+    def __init__(self, root=UPLOAD_SESSION_DIR, ttl_seconds=UPLOAD_SESSION_TTL_SECONDS):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _dir(self, upload_id):
+        if not upload_id.isalnum():
+            raise UploadError(404, "업로드 세션을 찾을 수 없습니다.")
+        return os.path.join(self.root, upload_id)
+
+    def _lock(self, upload_id):
+        with self._locks_guard:
+            return self._locks.setdefault(upload_id, threading.Lock())
+
+    def _load(self, upload_id):
+        session_dir = self._dir(upload_id)
+        try:
+            with open(os.path.join(session_dir, "meta.json")) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            raise UploadError(404, "업로드 세션을 찾을 수 없습니다.")
+        part_path = os.path.join(session_dir, "data.part")
+        meta["offset"] = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        return meta
+
+    def _public(self, meta):
+        return {k: meta[k] for k in ("upload_id", "kind", "name", "filename", "size", "offset")}
+
+    # --- 동기 구현 (스레드풀에서 실행) ---
+    def _create(self, kind, name, filename, size=None, sha256=None):
+        self.expire()
+        meta = {
+            "upload_id": uuid.uuid4().hex,
+            "kind": kind,
+            "name": name,
+            "filename": safe_filename(filename),
+            "size": size,
+            "sha256": sha256.lower() if sha256 else None,
+            "created_at": time.time(),
+        }
+        session_dir = self._dir(meta["upload_id"])
+        os.makedirs(session_dir)
+        open(os.path.join(session_dir, "data.part"), "wb").close()
+        with open(os.path.join(session_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        meta["offset"] = 0
+        return {**self._public(meta), "chunk_size": UPLOAD_CHUNK_BYTES}
+
+    def _status(self, upload_id):
+        return self._public(self._load(upload_id))
+
+    def _complete(self, upload_id):
+        """받은 내용을 확인하고 blob 임시 폴더로 옮깁니다. 결과의 "path" 를 blobs.add_file 에 넘기면 됩니다."""
+        with self._lock(upload_id):
+            meta = self._load(upload_id)
+            if meta["size"] is not None and meta["offset"] != meta["size"]:
+                raise UploadError(409, "아직 받지 못한 데이터가 있습니다.", offset=meta["offset"])
+            session_dir = self._dir(upload_id)
+            part_path = os.path.join(session_dir, "data.part")
+            digest = hash_file(part_path)
+            if meta["sha256"] and digest != meta["sha256"]:
+                raise UploadError(422, "SHA-256 이 일치하지 않습니다.", sha256=digest)
+
+            os.makedirs(BLOB_TMP_DIR, exist_ok=True)
+            tmp_path = _temp_path()
+            # 같은 파일 시스템이면 rename 한 번으로 끝납니다.
+            shutil.move(part_path, tmp_path)
+            shutil.rmtree(session_dir, ignore_errors=True)
+        with self._locks_guard:
+            self._locks.pop(upload_id, None)
+        return {**self._public(meta), "sha256": digest, "path": tmp_path}
+
+    def _abort(self, upload_id):
+        with self._lock(upload_id):
+            self._load(upload_id)
+            shutil.rmtree(self._dir(upload_id), ignore_errors=True)
+        with self._locks_guard:
+            self._locks.pop(upload_id, None)
+
+    def expire(self):
+        """TTL 이 지난 세션 폴더를 지웁니다."""
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return 0
+        removed = 0
+        deadline = time.time() - self.ttl_seconds
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            # 청크를 이어 쓰면 data.part 의 mtime 이 바뀌므로 마지막 활동 시각으로 씁니다.
+            part_path = os.path.join(entry.path, "data.part")
+            last_active = os.path.getmtime(part_path) if os.path.exists(part_path) else entry.stat().st_mtime
+            if last_active < deadline:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+        return removed
+
+    # --- 비동기 API ---
+    async def create(self, kind, name, filename, size=None, sha256=None):
+        return await run_in_threadpool(self._create, kind, name, filename, size, sha256)
+
+    async def status(self, upload_id):
+        return await run_in_threadpool(self._status, upload_id)
+
+    async def append(self, upload_id, offset, stream):
+        """stream(비동기 바이트 청크) 을 offset 위치부터 이어 씁니다. 새 offset 을 돌려줍니다."""
+        lock = self._lock(upload_id)
+        if not lock.acquire(blocking=False):
+            raise UploadError(409, "같은 세션에 다른 청크를 쓰는 중입니다.")
+        try:
+            meta = await run_in_threadpool(self._load, upload_id)
+            if offset != meta["offset"]:
+                raise UploadError(409, "offset 이 현재 업로드 위치와 다릅니다.", offset=meta["offset"])
+            part_path = os.path.join(self._dir(upload_id), "data.part")
+            fp = await run_in_threadpool(open, part_path, "ab")
+            started = time.perf_counter()
+            written = 0
+            buffer = bytearray()
+            try:
+                async for chunk in stream:
+                    buffer += chunk
+                    if meta["size"] is not None and meta["offset"] + written + len(buffer) > meta["size"]:
+                        raise UploadError(413, "선언한 파일 크기를 넘었습니다.", offset=meta["offset"] + written)
+                    if len(buffer) >= UPLOAD_CHUNK_BYTES:
+                        await run_in_threadpool(fp.write, bytes(buffer))
+                        written += len(buffer)
+                        buffer.clear()
+                if buffer:
+                    await run_in_threadpool(fp.write, bytes(buffer))
+                    written += len(buffer)
+            finally:
+                # 끊긴 요청이라도 이미 받은 부분은 남겨서 그 지점부터 다시 보낼 수 있게 합니다.
+                await run_in_threadpool(fp.close)
+                observe_transfer("upload", meta["kind"], written, time.perf_counter() - started)
+            return meta["offset"] + written
+        finally:
+            lock.release()
+
+    async def complete(self, upload_id):
+        return await run_in_threadpool(self._complete, upload_id)
+
+    async def abort(self, upload_id):
+        await run_in_threadpool(self._abort, upload_id)
@@ -10,17 +10,24 @@ interface DiscussionBoardProps {
 
 export default function DiscussionBoard({ targetType, targetId }: DiscussionBoardProps) {
   const [comments, setComments] = useState<any[]>([]);
+  const [total, setTotal] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [newComment, setNewComment] = useState("");
   const [loading, setLoading] = useState(false);
 
   // 현재 로그인한 사용자 이름 가져오기
   const currentUser = typeof window !== "undefined" ? localStorage.getItem("username") || "Anonymous" : "Anonymous";
 
-  const fetchComments = async () => {
+  // cursor 없이 부르면 첫 페이지부터 다시, cursor 를 주면 다음 페이지를 뒤에 이어 붙입니다.
+  const fetchComments = async (cursor?: string) => {
     try {
-      const res = await fetch(`http://localhost:8000/comments/${targetType}/${targetId}`);
+      const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+      const res = await fetch(`http://localhost:8000/comments/${targetType}/${targetId}${query}`);
       const data = await res.json();
-      setComments(data);
+      if (data.status !== "success") return;
+      setComments((prev) => (cursor ? [...prev, ...data.data] : data.data));
+      setNextCursor(data.next_cursor);
+      setTotal(data.total);
     } catch (e) {
       console.error("댓글을 불러오지 못했습니다.");
     }
@@ -60,7 +67,7 @@ export default function DiscussionBoard({ targetType, targetId }: DiscussionBoar
       <div className="p-5 border-b border-gray-100 bg-gray-50 flex items-center gap-2">
         <MessageSquare size={20} className="text-blue-600"/>
         <h3 className="text-lg font-bold text-gray-900">Community Discussion</h3>
-        <span className="bg-blue-100 text-blue-700 text-xs font-bold px-2 py-0.5 rounded-full">{comments.length}</span>
+        <span className="bg-blue-100 text-blue-700 text-xs font-bold px-2 py-0.5 rounded-full">{total}</span>
       </div>
 
       <div className="p-6 space-y-6">
@@ -84,6 +91,15 @@ export default function DiscussionBoard({ targetType, targetId }: DiscussionBoar
               </div>
             ))
           )}
+          {nextCursor && (
+            <button
+              type="button"
+              onClick={() => fetchComments(nextCursor)}
+              className="w-full py-2 text-sm font-bold text-blue-600 hover:bg-blue-50 rounded-lg transition-colors"
+            >
+              이전 의견 더 보기
+            </button>
+          )}
         </div>
 
         {/* 댓글 입력창 */}
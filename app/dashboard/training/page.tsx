@@ -14,6 +14,10 @@ export default function TrainingPage() {
 
   // 자동 스크롤을 위한 Ref
   const logsEndRef = useRef<HTMLDivElement>(null);
+  // 마지막으로 받은 로그 위치 (새 로그만 받아오기 위한 커서)
+  const cursorRef = useRef(0);
+  // /train/start 가 돌려준 작업 ID (다른 작업의 로그 커서와 섞이지 않게 항상 같이 보냄)
+  const jobIdRef = useRef<string | null>(null);
 
   // 로그가 추가될 때마다 스크롤 내리기
   useEffect(() => {
@@ -27,15 +31,21 @@ export default function TrainingPage() {
     if (isTraining) {
       interval = setInterval(async () => {
         try {
-          const res = await fetch('http://localhost:8000/train/status');
+          const res = await fetch(`http://localhost:8000/train/status?job_id=${jobIdRef.current}&since=${cursorRef.current}`);
           const data = await res.json();
           
-          setLogs(data.logs);
+          if (data.logs.length > 0) setLogs(prev => [...prev, ...data.logs]);
+          cursorRef.current = data.cursor;
           setProgress(data.progress);
           
-          // 학습이 끝났으면 Polling 중단
-          if (!data.is_training && data.progress === 100) {
+          // 작업이 끝났으면 (완료/실패/취소) Polling 중단
+          if (!data.is_training) {
             setIsTraining(false);
+            if (data.status === "failed") {
+              setLogs(prev => [...prev, `[System] Training failed: ${data.error ?? "unknown error"}`]);
+            } else if (data.status === "cancelled") {
+              setLogs(prev => [...prev, "[System] Training cancelled."]);
+            }
           }
         } catch (e) {
           console.error("Connection Error");
@@ -57,9 +67,11 @@ export default function TrainingPage() {
       const data = await res.json();
       
       if (data.status === "success") {
+        cursorRef.current = 0;
+        jobIdRef.current = data.job_id;
         setIsTraining(true);
       } else {
-        alert("이미 학습이 진행 중입니다.");
+        alert(data.message ?? "학습을 시작하지 못했습니다.");
       }
     } catch (e) {
       alert("AI 서버 연결 실패! (api/server.py 실행 확인)");
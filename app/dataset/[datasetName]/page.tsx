@@ -30,7 +30,7 @@ export default function PublicDatasetPage({ params }: { params: Promise<{ datase
 
     const fetchData = async () => {
       try {
-        const resData = await fetch(`http://127.0.0.1:8000/datasets/${datasetName}`, { cache: "no-store" });
+        const resData = await fetch(`http://127.0.0.1:8000/datasets/${datasetName}${storedName ? `?username=${encodeURIComponent(storedName)}` : ""}`, { cache: "no-store" });
         const resultData = await resData.json();
         if (resultData.status === "success") setDatasetData(resultData.data);
 
@@ -80,7 +80,7 @@ export default function PublicDatasetPage({ params }: { params: Promise<{ datase
         setDatasetData((prev: any) => ({
           ...prev,
           likes: data.likes,
-          liked_by: data.liked_by
+          liked: data.liked
         }));
       }
     } catch (error) {
@@ -115,7 +115,7 @@ export default function PublicDatasetPage({ params }: { params: Promise<{ datase
                     <span className="flex items-center gap-1.5"><Download size={16} className="text-blue-500"/> 다운로드 {datasetData.downloads || 0}</span>
                     {/* 🟢 내가 누른 명단에 있는지 실시간 확인 */}
                     {(() => {
-                        const isLiked = datasetData?.liked_by && datasetData.liked_by.split(',').includes(username);
+                        const isLiked = !!datasetData?.liked;
                         return (
                             <button onClick={handleLike} className={`flex items-center gap-1.5 hover:scale-105 transition-all cursor-pointer font-bold ${isLiked ? "text-red-600" : "text-gray-500 hover:text-red-600"}`}>
                                 <Heart size={16} className={`${isLiked ? "text-red-600 fill-red-600" : "text-gray-400 fill-transparent"} transition-colors`}/> 좋아요 {datasetData?.likes || 0}
@@ -28,7 +28,7 @@ export default function PublicModelPage({ params }: { params: Promise<{ modelNam
 
     const fetchData = async () => {
       try {
-        const resData = await fetch(`http://127.0.0.1:8000/models/${modelName}`, { cache: "no-store" });
+        const resData = await fetch(`http://127.0.0.1:8000/models/${modelName}${storedName ? `?username=${encodeURIComponent(storedName)}` : ""}`, { cache: "no-store" });
         const resultData = await resData.json();
         if (resultData.status === "success") setModelData(resultData.data);
 
@@ -79,7 +79,7 @@ export default function PublicModelPage({ params }: { params: Promise<{ modelNam
         setModelData((prev: any) => ({
           ...prev,
           likes: data.likes,
-          liked_by: data.liked_by
+          liked: data.liked
         }));
       }
     } catch (error) {
@@ -114,7 +114,7 @@ export default function PublicModelPage({ params }: { params: Promise<{ modelNam
                     <span className="flex items-center gap-1.5"><Download size={16} className="text-blue-500"/> 다운로드 {modelData.downloads || 0}</span>
                     {/* 🟢 내가 누른 명단에 있는지 실시간 확인 */}
                     {(() => {
-                        const isLiked = modelData?.liked_by && modelData.liked_by.split(',').includes(username);
+                        const isLiked = !!modelData?.liked;
                         return (
                             <button onClick={handleLike} className={`flex items-center gap-1.5 hover:scale-105 transition-all cursor-pointer font-bold ${isLiked ? "text-red-600" : "text-gray-500 hover:text-red-600"}`}>
                                 <Heart size={16} className={`${isLiked ? "text-blue-600 fill-blue-600" : "text-gray-400 fill-transparent"} transition-colors`}/> 좋아요 {modelData?.likes || 0}